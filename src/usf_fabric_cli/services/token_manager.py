@@ -6,18 +6,19 @@ Tokens are refreshed 60 seconds before expiry to maintain continuous authenticat
 during long-running Fabric deployments.
 
 Key Features:
-- Proactive refresh (60s buffer before expiry)
+- Proactive refresh (60s buffer before expiry, jittered by +/-10%)
 - Azure AD Service Principal support via ClientSecretCredential
 - Thread-safe token access
 - Fabric CLI re-authentication on refresh
 """
 
 import logging
+import random
 import subprocess
 import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Callable, Optional
 
 try:
@@ -38,6 +39,13 @@ logger = logging.getLogger(__name__)
 # Token refresh buffer - refresh this many seconds before actual expiry
 DEFAULT_REFRESH_BUFFER_SECONDS = 60
 
+# Each token's buffer is scaled by a random factor in [1 - x, 1 + x] so that
+# workers started together do not all re-authenticate at the same instant
+REFRESH_BUFFER_JITTER = 0.1
+
+# A successful Fabric CLI login is reused for this long before logging in again
+DEFAULT_CLI_REFRESH_TTL = timedelta(minutes=5)
+
 # Fabric API scope for token acquisition
 FABRIC_SCOPE = "https://api.fabric.microsoft.com/.default"
 
@@ -46,6 +54,9 @@ FABRIC_SCOPE = "https://api.fabric.microsoft.com/.default"
 class TokenInfo:
     """Token metadata for tracking refresh timing."""
 
+    # Explicit slots: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("token", "expires_on", "acquired_at")
+
     token: str
     expires_on: datetime
     acquired_at: datetime
@@ -80,7 +91,8 @@ class TokenManager:
             client_id: Azure AD application (client) ID
             client_secret: Service Principal secret
             tenant_id: Azure AD tenant ID
-            refresh_buffer_seconds: Seconds before expiry to trigger refresh
+            refresh_buffer_seconds: Seconds before expiry to trigger refresh;
+                each token uses this value +/- REFRESH_BUFFER_JITTER (10%)
             on_token_refresh: Optional callback when token is refreshed
         """
         if not AZURE_IDENTITY_AVAILABLE:
@@ -93,6 +105,8 @@ class TokenManager:
         self._client_secret = client_secret
         self._tenant_id = tenant_id
         self._refresh_buffer_seconds = refresh_buffer_seconds
+        # Jittered buffer for the current token, redrawn on each acquisition
+        self._effective_buffer_seconds = float(refresh_buffer_seconds)
         self._on_token_refresh = on_token_refresh
 
         self._credential = ClientSecretCredential(
@@ -102,7 +116,10 @@ class TokenManager:
         )
         self._token_info: Optional[TokenInfo] = None
         self._last_cli_auth: Optional[datetime] = None
+        self._cli_refresh_ttl = DEFAULT_CLI_REFRESH_TTL
         self._lock = threading.Lock()
+        # Serializes CLI logins so concurrent callers share one fab session
+        self._cli_auth_lock = threading.Lock()
 
         logger.info(
             "TokenManager initialized with %ds refresh buffer", refresh_buffer_seconds
@@ -138,12 +155,12 @@ class TokenManager:
         if seconds_left is None:
             return True
 
-        should_refresh = seconds_left <= self._refresh_buffer_seconds
+        should_refresh = seconds_left <= self._effective_buffer_seconds
         if should_refresh:
             logger.debug(
-                "Token refresh needed: %.1fs until expiry (buffer: %ds)",
+                "Token refresh needed: %.1fs until expiry (buffer: %.1fs)",
                 seconds_left,
-                self._refresh_buffer_seconds,
+                self._effective_buffer_seconds,
             )
         return should_refresh
 
@@ -192,6 +209,9 @@ class TokenManager:
         with self._lock:
             if self._should_refresh():
                 self._token_info = self._acquire_token()
+                self._effective_buffer_seconds = self._refresh_buffer_seconds * (
+                    random.uniform(1 - REFRESH_BUFFER_JITTER, 1 + REFRESH_BUFFER_JITTER)
+                )
 
                 # Notify callback if registered
                 if self._on_token_refresh and self._token_info:
@@ -204,16 +224,37 @@ class TokenManager:
                 raise RuntimeError("Token acquisition failed -- no token available")
             return self._token_info.token
 
-    def refresh_fabric_cli_auth(self) -> bool:
+    def _cli_auth_is_recent(self) -> bool:
+        """Check if the last successful CLI login is within the refresh TTL."""
+        if not self._last_cli_auth:
+            return False
+        age = datetime.now(timezone.utc) - self._last_cli_auth
+        return age < self._cli_refresh_ttl
+
+    def refresh_fabric_cli_auth(self, force: bool = False) -> bool:
         """
         Re-authenticate the Fabric CLI with fresh credentials.
 
         This should be called when the token has been refreshed to ensure
-        the fab CLI's cached authentication is updated.
+        the fab CLI's cached authentication is updated. The login uses the
+        Service Principal directly, so a successful login within the last
+        few minutes (DEFAULT_CLI_REFRESH_TTL) is reused instead of spawning
+        the fab logout/login subprocesses again.
+
+        Args:
+            force: Log in again even if the last login is still recent
 
         Returns:
             True if re-authentication succeeded, False otherwise
         """
+        with self._cli_auth_lock:
+            if not force and self._cli_auth_is_recent():
+                logger.debug("Fabric CLI auth is recent, skipping re-login")
+                return True
+            return self._login_fabric_cli()
+
+    def _login_fabric_cli(self) -> bool:
+        """Run fab logout and login for the Service Principal."""
         logger.info("Re-authenticating Fabric CLI with Service Principal...")
 
         try:
@@ -311,9 +352,8 @@ sys.exit(main())
                 datetime.now(timezone.utc) - self._last_cli_auth
             ).total_seconds()
 
-        needs_cli_refresh = (
-            token_changed or cli_auth_age is None or cli_auth_age > max_age_seconds
-        )
+        cli_auth_stale = cli_auth_age is not None and cli_auth_age > max_age_seconds
+        needs_cli_refresh = token_changed or cli_auth_age is None or cli_auth_stale
 
         if needs_cli_refresh:
             logger.info(
@@ -321,7 +361,8 @@ sys.exit(main())
                 token_changed,
                 cli_auth_age,
             )
-            return self.refresh_fabric_cli_auth()
+            # A caller-imposed max age below the CLI refresh TTL must still win
+            return self.refresh_fabric_cli_auth(force=cli_auth_stale)
 
         return True
 
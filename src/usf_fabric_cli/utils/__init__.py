@@ -6,7 +6,7 @@ from usf_fabric_cli.utils.config import (
     WorkspaceConfig,
     get_environment_variables,
 )
-from usf_fabric_cli.utils.retry import retry_with_backoff
+from usf_fabric_cli.utils.retry import aretry_with_backoff, retry_with_backoff
 from usf_fabric_cli.utils.secrets import FabricSecrets
 from usf_fabric_cli.utils.telemetry import TelemetryClient
 from usf_fabric_cli.utils.templating import (
@@ -24,4 +24,5 @@ __all__ = [
     "ArtifactTemplateEngine",
     "FabricArtifactTemplater",
     "retry_with_backoff",
+    "aretry_with_backoff",
 ]
@@ -8,14 +8,16 @@ Key Features:
 - Exponential backoff with configurable base/max delay
 - Jitter to prevent thundering herd
 - Customizable retryable error detection
-- Decorator for easy application to functions
+- Decorators for easy application to sync and async functions
 """
 
+import asyncio
 import logging
 import random
+import re
 import time
-from functools import wraps
-from typing import Any, Callable, Optional, TypeVar
+from functools import lru_cache, wraps
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import requests
 
@@ -25,6 +27,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_BASE_DELAY = 1.0  # seconds
 DEFAULT_MAX_DELAY = 30.0  # seconds
+_MAX_BACKOFF_SHIFT = 62
+
+# Backoff strategies accepted by calculate_backoff / the retry decorators
+BACKOFF_EXPONENTIAL = "exponential"
+BACKOFF_DECORRELATED = "decorrelated"
 
 # Error patterns that indicate transient, retryable failures
 RETRYABLE_ERROR_PATTERNS = [
@@ -42,6 +49,32 @@ RETRYABLE_ERROR_PATTERNS = [
     "server busy",
 ]
 
+# One case-insensitive alternation over all patterns: a single scan per
+# message and no lowercased copy of it.
+_RETRYABLE_ERROR_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in RETRYABLE_ERROR_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Bit N is set when HTTP status N is retryable (401, 429, 502, 503, 504)
+_RETRYABLE_STATUS_MASK = (1 << 401) | (1 << 429) | (1 << 502) | (1 << 503) | (1 << 504)
+
+# Exception types that are retryable regardless of their message
+_RETRYABLE_EXCEPTION_TYPES = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+# Exceptions the retry decorators intercept; anything else propagates as-is
+_RETRY_DECORATOR_EXCEPTIONS = (
+    ValueError,
+    RuntimeError,
+    OSError,
+    KeyError,
+    TypeError,
+    AttributeError,
+)
+
 T = TypeVar("T")
 
 
@@ -55,8 +88,15 @@ def is_retryable_error(error_message: str) -> bool:
     Returns:
         True if error appears retryable
     """
-    error_lower = error_message.lower()
-    return any(pattern in error_lower for pattern in RETRYABLE_ERROR_PATTERNS)
+    if not isinstance(error_message, str):
+        error_message = str(error_message)
+    return _is_retryable_message(error_message)
+
+
+@lru_cache(maxsize=512)
+def _is_retryable_message(error_message: str) -> bool:
+    """Cached pattern scan; retry loops tend to see the same message repeatedly."""
+    return bool(error_message) and _RETRYABLE_ERROR_RE.search(error_message) is not None
 
 
 def is_retryable_http_status(status_code: int) -> bool:
@@ -69,8 +109,11 @@ def is_retryable_http_status(status_code: int) -> bool:
     Returns:
         True if status code is retryable (401, 429, 502, 503, 504).
         401 is included because token refresh between retries may resolve it.
+        Anything that is not an int (e.g. a mocked response) is not retryable.
     """
-    return status_code in (401, 429, 502, 503, 504)
+    if not isinstance(status_code, int):
+        return False
+    return 0 <= status_code <= 599 and bool(_RETRYABLE_STATUS_MASK >> status_code & 1)
 
 
 def is_retryable_exception(exception: Exception) -> bool:
@@ -86,22 +129,20 @@ def is_retryable_exception(exception: Exception) -> bool:
     Returns:
         True if exception appears retryable
     """
-    # Check for requests HTTP errors with retryable status codes
-    if isinstance(exception, requests.exceptions.HTTPError):
-        if hasattr(exception, "response") and exception.response is not None:
-            return is_retryable_http_status(exception.response.status_code)
-
-    # Check for connection/timeout errors
-    if isinstance(
-        exception,
-        (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-        ),
-    ):
+    # Connection/timeout errors are always transient
+    if isinstance(exception, _RETRYABLE_EXCEPTION_TYPES):
         return True
 
-    # Fall back to error message pattern matching
+    # HTTP errors with a response are decided by status code alone, so the
+    # (potentially large) exception message is never formatted
+    if isinstance(exception, requests.exceptions.HTTPError):
+        response = getattr(exception, "response", None)
+        code = getattr(response, "status_code", None)
+        if code is not None:
+            return is_retryable_http_status(code)
+
+    # Fall back to error message pattern matching (includes HTTPErrors
+    # raised without a response)
     return is_retryable_error(str(exception))
 
 
@@ -110,35 +151,116 @@ def calculate_backoff(
     base_delay: float = DEFAULT_BASE_DELAY,
     max_delay: float = DEFAULT_MAX_DELAY,
     jitter: bool = True,
+    mode: str = BACKOFF_EXPONENTIAL,
+    prev_delay: Optional[float] = None,
 ) -> float:
     """
-    Calculate exponential backoff delay with optional jitter.
+    Calculate the delay before the next retry attempt.
+
+    Two modes are supported:
+
+    - ``"exponential"`` (default): ``base_delay * 2**attempt`` capped at
+      ``max_delay``, with optional +/-25% jitter.
+    - ``"decorrelated"``: AWS-style decorrelated jitter,
+      ``min(max_delay, uniform(base_delay, prev_delay * 3))``. Each delay
+      depends on the previous one rather than the attempt number, which
+      spreads retries from many concurrent clients more evenly.
 
     Args:
         attempt: Current attempt number (0-indexed)
         base_delay: Initial delay in seconds
         max_delay: Maximum delay cap in seconds
-        jitter: Whether to add random jitter (+/-25%)
+        jitter: Whether to add random jitter (+/-25%); exponential mode only
+        mode: Backoff strategy, ``"exponential"`` or ``"decorrelated"``
+        prev_delay: Previous delay returned for this retry chain
+            (decorrelated mode only; ``None`` on the first retry)
 
     Returns:
         Delay in seconds
+
+    Raises:
+        ValueError: If ``mode`` is not a known backoff strategy
     """
-    delay = min(base_delay * (2**attempt), max_delay)
+    if mode == BACKOFF_DECORRELATED:
+        upper = max(base_delay, prev_delay or base_delay) * 3.0
+        return max(0, min(max_delay, random.uniform(base_delay, upper)))
+    if mode != BACKOFF_EXPONENTIAL:
+        raise ValueError(f"Unknown backoff mode: {mode!r}")
+
+    # Integer shift instead of float pow; clamping the exponent keeps the
+    # shift count valid and the product finite for absurd attempt counts
+    # (max_delay wins long before).
+    shift = min(max(attempt, 0), _MAX_BACKOFF_SHIFT)
+    delay = min(base_delay * (1 << shift), max_delay)
 
     if jitter:
-        # Add jitter (+/-25%) to prevent thundering herd
-        jitter_range = delay * 0.25
-        delay = delay + (2 * random.random() - 1) * jitter_range
+        # Scale by a uniform factor in [0.75, 1.25) to prevent thundering herd
+        delay *= 0.75 + 0.5 * random.random()
 
     return max(0, delay)
 
 
+def _prepare_retry(
+    error: Exception,
+    attempt: int,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    retryable_check: Optional[Callable[[Exception], bool]],
+    on_retry: Optional[Callable[[Exception, int, float], None]],
+    backoff_mode: str = BACKOFF_EXPONENTIAL,
+    prev_delay: Optional[float] = None,
+) -> Optional[float]:
+    """
+    Decide whether a failed attempt should be retried.
+
+    Logs the retry and invokes the optional callback. Shared by the sync
+    and async decorators so both follow the same policy.
+
+    Returns:
+        Delay in seconds before the next attempt, or None if the error
+        should be re-raised.
+    """
+    # Final attempt: no further try will follow, so skip classification,
+    # backoff and the on_retry callback entirely
+    if attempt >= max_retries:
+        return None
+
+    should_retry = (
+        retryable_check(error) if retryable_check else is_retryable_exception(error)
+    )
+    if not should_retry:
+        return None
+
+    delay = calculate_backoff(
+        attempt, base_delay, max_delay, mode=backoff_mode, prev_delay=prev_delay
+    )
+
+    logger.warning(
+        "Retryable error on attempt %d/%d: %s. Retrying in %.2fs...",
+        attempt + 1,
+        max_retries + 1,
+        str(error),
+        delay,
+    )
+
+    # Call optional retry callback
+    if on_retry:
+        try:
+            on_retry(error, attempt, delay)
+        except (ValueError, RuntimeError, TypeError) as cb_err:
+            logger.debug("Retry callback failed: %s", cb_err)
+
+    return delay
+
+
 def retry_with_backoff(
     max_retries: int = DEFAULT_MAX_RETRIES,
     base_delay: float = DEFAULT_BASE_DELAY,
     max_delay: float = DEFAULT_MAX_DELAY,
     retryable_check: Optional[Callable[[Exception], bool]] = None,
     on_retry: Optional[Callable[[Exception, int, float], None]] = None,
+    backoff_mode: str = BACKOFF_EXPONENTIAL,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator for retrying functions with exponential backoff.
@@ -152,6 +274,8 @@ def retry_with_backoff(
         max_delay: Maximum delay between retries in seconds (default: 30.0)
         retryable_check: Custom function to determine if exception is retryable
         on_retry: Optional callback(exception, attempt, delay) called before retry
+        backoff_mode: ``"exponential"`` (default) or ``"decorrelated"``;
+            see calculate_backoff
 
     Returns:
         Decorated function with retry logic
@@ -168,49 +292,86 @@ def retry_with_backoff(
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             last_exception: Optional[Exception] = None
+            delay: Optional[float] = None
 
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except (
-                    ValueError,
-                    RuntimeError,
-                    OSError,
-                    KeyError,
-                    TypeError,
-                    AttributeError,
-                ) as e:
+                except _RETRY_DECORATOR_EXCEPTIONS as e:
                     last_exception = e
-                    error_str = str(e)
-
-                    # Check if error is retryable
-                    should_retry = (
-                        retryable_check(e)
-                        if retryable_check
-                        else is_retryable_exception(e)
+                    delay = _prepare_retry(
+                        e,
+                        attempt,
+                        max_retries,
+                        base_delay,
+                        max_delay,
+                        retryable_check,
+                        on_retry,
+                        backoff_mode,
+                        delay,
                     )
-
-                    if not should_retry or attempt >= max_retries:
+                    if delay is None:
                         raise
+                    time.sleep(delay)
 
-                    delay = calculate_backoff(attempt, base_delay, max_delay)
+            # Should not reach here, but just in case
+            if last_exception:
+                raise last_exception
+            raise RuntimeError("Retry loop completed without returning or raising")
 
-                    logger.warning(
-                        "Retryable error on attempt %d/%d: %s. Retrying in %.2fs...",
-                        attempt + 1,
-                        max_retries + 1,
-                        error_str,
-                        delay,
-                    )
+        return wrapper
 
-                    # Call optional retry callback
-                    if on_retry:
-                        try:
-                            on_retry(e, attempt, delay)
-                        except (ValueError, RuntimeError, TypeError) as cb_err:
-                            logger.debug("Retry callback failed: %s", cb_err)
+    return decorator
 
-                    time.sleep(delay)
+
+def aretry_with_backoff(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+    retryable_check: Optional[Callable[[Exception], bool]] = None,
+    on_retry: Optional[Callable[[Exception, int, float], None]] = None,
+    backoff_mode: str = BACKOFF_EXPONENTIAL,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Async counterpart of retry_with_backoff for ``async def`` functions.
+
+    Behaves exactly like retry_with_backoff, but waits between attempts
+    with ``asyncio.sleep`` so other coroutines keep running during the
+    backoff instead of the event loop being blocked.
+
+    Example:
+        @aretry_with_backoff(max_retries=5, base_delay=2.0)
+        async def call_api():
+            ...
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[T]],
+    ) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            last_exception: Optional[Exception] = None
+            delay: Optional[float] = None
+
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except _RETRY_DECORATOR_EXCEPTIONS as e:
+                    last_exception = e
+                    delay = _prepare_retry(
+                        e,
+                        attempt,
+                        max_retries,
+                        base_delay,
+                        max_delay,
+                        retryable_check,
+                        on_retry,
+                        backoff_mode,
+                        delay,
+                    )
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
 
             # Should not reach here, but just in case
             if last_exception:
@@ -260,7 +421,7 @@ def retry_request(
         except requests.RequestException as e:
             last_exception = e
 
-            if not is_retryable_exception(e) or attempt >= max_retries:
+            if attempt >= max_retries or not is_retryable_exception(e):
                 raise
 
             delay = calculate_backoff(attempt, base_delay, max_delay)
@@ -13,9 +13,10 @@ across development, staging, and production environments.
 
 import logging
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
-from pydantic import AliasChoices, Field, field_validator
+from pydantic import AliasChoices, Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 try:
@@ -28,6 +29,63 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# (field, env var, Key Vault secret name) filled by load_with_fallback when the
+# field is still unset after env vars and the .env file have been read
+_KEYVAULT_FIELDS = (
+    ("azure_client_id", "AZURE_CLIENT_ID", "azure-client-id"),
+    ("azure_client_secret", "AZURE_CLIENT_SECRET", "azure-client-secret"),
+    ("tenant_id", "TENANT_ID", "tenant-id"),
+    ("fabric_token", "FABRIC_TOKEN", "fabric-token"),
+    ("github_token", "GITHUB_TOKEN", "github-token"),
+    ("azure_devops_pat", "AZURE_DEVOPS_PAT", "azure-devops-pat"),
+)
+
+# Upper bound on concurrent Key Vault requests in load_with_fallback
+_KEYVAULT_MAX_WORKERS = 8
+
+# Env var names per FabricSecrets field (aliases grouped). When every field is
+# already in os.environ, a .env file cannot contribute anything.
+_SETTINGS_ENV_NAMES = (
+    ("AZURE_KEYVAULT_URL",),
+    ("AZURE_CLIENT_ID",),
+    ("AZURE_CLIENT_SECRET",),
+    ("TENANT_ID", "AZURE_TENANT_ID"),
+    ("FABRIC_TOKEN",),
+    ("GITHUB_TOKEN",),
+    ("AZURE_DEVOPS_PAT",),
+)
+
+# Service Principal fields checked by validate_fabric_auth, with the env var
+# named in the "missing credentials" message
+_SERVICE_PRINCIPAL_FIELDS = (
+    ("azure_client_id", "AZURE_CLIENT_ID"),
+    ("azure_client_secret", "AZURE_CLIENT_SECRET"),
+    ("tenant_id", "TENANT_ID"),
+)
+
+# Git provider (lowercased) -> (credential field, error when it is missing)
+_GITHUB_AUTH = ("github_token", "Missing GitHub authentication token (GITHUB_TOKEN)")
+_AZURE_DEVOPS_AUTH = ("azure_devops_pat", "Missing Azure DevOps PAT (AZURE_DEVOPS_PAT)")
+_GIT_PROVIDER_AUTH = {
+    "github": _GITHUB_AUTH,
+    "azuredevops": _AZURE_DEVOPS_AUTH,
+    "azure_devops": _AZURE_DEVOPS_AUTH,
+    "ado": _AZURE_DEVOPS_AUTH,
+}
+
+
+def _resolve_env_file(env_file: Optional[str]) -> Optional[str]:
+    """Return ``env_file``, or None when the environment already sets every field.
+
+    Environment variables take priority over the .env file, so parsing it is
+    wasted work once all settings are present (typical in CI).
+    """
+    if env_file is not None and all(
+        any(name in os.environ for name in names) for names in _SETTINGS_ENV_NAMES
+    ):
+        return None
+    return env_file
+
 
 class FabricSecrets(BaseSettings):
     """
@@ -60,6 +118,11 @@ class FabricSecrets(BaseSettings):
     github_token: Optional[str] = Field(default=None, alias="GITHUB_TOKEN")
     azure_devops_pat: Optional[str] = Field(default=None, alias="AZURE_DEVOPS_PAT")
 
+    # Key Vault client reused across secret lookups, keyed by vault URL so a
+    # changed azure_keyvault_url gets a fresh client
+    _kv_client: Any = PrivateAttr(default=None)
+    _kv_client_url: Optional[str] = PrivateAttr(default=None)
+
     @field_validator("tenant_id", mode="before")
     @classmethod
     def normalize_tenant_id(cls, v):
@@ -68,17 +131,27 @@ class FabricSecrets(BaseSettings):
             return v
         return os.getenv("AZURE_TENANT_ID") or v
 
+    def _get_keyvault_client(self) -> Any:
+        """Return the cached SecretClient, creating it for the current vault URL."""
+        if self._kv_client is None or self._kv_client_url != self.azure_keyvault_url:
+            credential = DefaultAzureCredential()
+            self._kv_client = SecretClient(
+                vault_url=self.azure_keyvault_url, credential=credential
+            )
+            self._kv_client_url = self.azure_keyvault_url
+        return self._kv_client
+
     def _get_from_keyvault(self, secret_name: str) -> Optional[str]:
-        """Retrieve a secret from Azure Key Vault if configured."""
+        """Retrieve a secret from Azure Key Vault if configured.
+
+        The credential and SecretClient are created on first use and reused,
+        so repeated lookups share one auth handshake and connection pool.
+        """
         if not self.azure_keyvault_url or not KEYVAULT_AVAILABLE:
             return None
 
         try:
-            credential = DefaultAzureCredential()
-            client = SecretClient(
-                vault_url=self.azure_keyvault_url, credential=credential
-            )
-            secret = client.get_secret(secret_name)
+            secret = self._get_keyvault_client().get_secret(secret_name)
             return secret.value
         except (ValueError, RuntimeError, OSError) as e:
             logger.warning("Azure Key Vault error [%s]: %s", type(e).__name__, e)
@@ -133,17 +206,14 @@ class FabricSecrets(BaseSettings):
         if self.fabric_token:
             return (True, "")
 
-        if self.validate_service_principal():
+        missing = [
+            env_name
+            for field, env_name in _SERVICE_PRINCIPAL_FIELDS
+            if not getattr(self, field)
+        ]
+        if not missing:
             return (True, "")
 
-        missing = []
-        if not self.azure_client_id:
-            missing.append("AZURE_CLIENT_ID")
-        if not self.azure_client_secret:
-            missing.append("AZURE_CLIENT_SECRET")
-        if not self.tenant_id:
-            missing.append("TENANT_ID")
-
         error_msg = f"Missing Fabric authentication credentials: {', '.join(missing)}"
         return (False, error_msg)
 
@@ -157,15 +227,13 @@ class FabricSecrets(BaseSettings):
         Returns:
             (is_valid, error_message) tuple
         """
-        if provider.lower() == "github":
-            if self.github_token:
-                return (True, "")
-            return (False, "Missing GitHub authentication token (GITHUB_TOKEN)")
-        elif provider.lower() in ["azuredevops", "azure_devops", "ado"]:
-            if self.azure_devops_pat:
-                return (True, "")
-            return (False, "Missing Azure DevOps PAT (AZURE_DEVOPS_PAT)")
-        return (False, f"Unknown Git provider: {provider}")
+        auth = _GIT_PROVIDER_AUTH.get(provider.lower())
+        if auth is None:
+            return (False, f"Unknown Git provider: {provider}")
+        field, error_msg = auth
+        if getattr(self, field):
+            return (True, "")
+        return (False, error_msg)
 
     def is_ci_environment(self) -> bool:
         """Returns True if running in continuous integration environment."""
@@ -207,35 +275,26 @@ class FabricSecrets(BaseSettings):
         if env_file == ".env":
             env_file = os.getenv("USF_ENV_FILE", ".env")
 
-        if env_file is None:
-            instance = cls(_env_file=None)  # type: ignore[call-arg]
-        else:
-            instance = cls(_env_file=env_file)  # type: ignore[call-arg]
+        instance = cls(_env_file=_resolve_env_file(env_file))  # type: ignore[call-arg]
 
-        # If Key Vault is configured, attempt to populate missing secrets
+        # If Key Vault is configured, populate missing secrets concurrently —
+        # each lookup is an independent network round-trip
         if instance.azure_keyvault_url and KEYVAULT_AVAILABLE:
-            if not instance.azure_client_id:
-                instance.azure_client_id = instance.get_secret(
-                    "AZURE_CLIENT_ID", "azure-client-id"
-                )
-            if not instance.azure_client_secret:
-                instance.azure_client_secret = instance.get_secret(
-                    "AZURE_CLIENT_SECRET", "azure-client-secret"
-                )
-            if not instance.tenant_id:
-                instance.tenant_id = instance.get_secret("TENANT_ID", "tenant-id")
-            if not instance.fabric_token:
-                instance.fabric_token = instance.get_secret(
-                    "FABRIC_TOKEN", "fabric-token"
-                )
-            if not instance.github_token:
-                instance.github_token = instance.get_secret(
-                    "GITHUB_TOKEN", "github-token"
-                )
-            if not instance.azure_devops_pat:
-                instance.azure_devops_pat = instance.get_secret(
-                    "AZURE_DEVOPS_PAT", "azure-devops-pat"
-                )
+            missing = [f for f in _KEYVAULT_FIELDS if not getattr(instance, f[0])]
+            if missing:
+                # Create the shared client up front so workers don't race to
+                # build their own; a failure here resurfaces per lookup below
+                try:
+                    instance._get_keyvault_client()
+                except (ValueError, RuntimeError, OSError):
+                    pass
+                workers = min(_KEYVAULT_MAX_WORKERS, len(missing))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    values = executor.map(
+                        lambda f: instance.get_secret(f[1], f[2]), missing
+                    )
+                    for (field, _, _), value in zip(missing, values):
+                        setattr(instance, field, value)
 
         return instance
 
@@ -254,7 +313,9 @@ def get_secrets() -> FabricSecrets:
         ValueError: When required authentication credentials are missing
     """
     # USF_ENV_FILE overrides for multi-client setups (defaults to .env).
-    secrets = FabricSecrets(_env_file=os.getenv("USF_ENV_FILE", ".env"))
+    secrets = FabricSecrets(
+        _env_file=_resolve_env_file(os.getenv("USF_ENV_FILE", ".env"))
+    )
 
     # Backfill os.environ to ensure subprocesses (like fab CLI) and legacy
     # os.getenv() calls see variables that were loaded by Pydantic from .env
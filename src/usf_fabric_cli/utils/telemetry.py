@@ -4,17 +4,46 @@ from __future__ import annotations
 
 import json
 import os
+import weakref
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict, Optional, Tuple
 
 from usf_fabric_cli.exceptions import FabricTelemetryError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 MAX_LOG_SIZE_BYTES = int(os.getenv("FABRIC_TELEMETRY_MAX_MB", "50")) * 1024 * 1024
 
+# Write buffer for the long-lived log handle; each event is flushed anyway
+_WRITE_BUFFER_BYTES = 1 << 16
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    """Serialize an event to one JSON line, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS matches json.dumps, which stringifies int keys
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(record)
+
 
 class TelemetryClient:
-    """Writes Fabric CLI command telemetry to JSONL."""
+    """Writes Fabric CLI command telemetry to JSONL.
+
+    The log file is opened on the first event and kept open for later ones;
+    call close() (or use the client as a context manager) to release it.
+    A client that is never closed releases the handle when it is garbage
+    collected or at interpreter exit.
+
+    Several clients may share one log file. Before each event the client
+    checks that its handle still refers to the file at the log path, and
+    reopens it if another client has rotated the log in the meantime.
+    """
 
     def __init__(
         self,
@@ -32,18 +61,78 @@ class TelemetryClient:
             self._log_dir = Path.home() / ".fabric-cli"
 
         self._log_file = self._log_dir / "fabric_cli_telemetry.jsonl"
+        self._fh: Optional[IO[str]] = None
+        # (st_dev, st_ino) of the file behind the open handle
+        self._identity: Optional[Tuple[int, int]] = None
+        self._closer: Optional[weakref.finalize] = None
+        # Bytes in the log file, tracked in-process while the handle is open
+        self._size = 0
+
+    def __enter__(self) -> "TelemetryClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     @property
     def _max_log_size(self) -> int:
         """Maximum log file size before rotation."""
         return MAX_LOG_SIZE_BYTES
 
+    def _handle_is_current(self) -> bool:
+        """Whether the open handle still refers to the file at the log path."""
+        try:
+            st = os.stat(self._log_file)
+        except FileNotFoundError:
+            return False
+        return (st.st_dev, st.st_ino) == self._identity
+
+    def _open(self) -> IO[str]:
+        """Return the append handle, opening it (and the log dir) if needed.
+
+        A handle whose file has been renamed away by another client is closed
+        and the log path reopened. The file size is read once per open and
+        then tracked in-process.
+        """
+        if self._fh is not None and not self._handle_is_current():
+            self.close()
+        if self._fh is None:
+            self._log_dir.mkdir(parents=True, exist_ok=True)
+            fh = open(
+                self._log_file, "a", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES
+            )
+            # Closes the handle if the client is collected or the process exits
+            self._closer = weakref.finalize(self, fh.close)
+            st = os.fstat(fh.fileno())
+            self._fh = fh
+            self._identity = (st.st_dev, st.st_ino)
+            self._size = st.st_size
+        return self._fh
+
     def _rotate_if_needed(self) -> None:
-        """Rotate log file if it exceeds size threshold."""
-        if (
-            self._log_file.exists()
-            and self._log_file.stat().st_size > self._max_log_size
-        ):
+        """Rotate log file if it exceeds size threshold.
+
+        The tracked size only triggers the check. The log path is stat-ed
+        again before renaming, since other writers may have appended to the
+        file or rotated it already.
+        """
+        if self._size <= self._max_log_size:
+            return
+
+        try:
+            st = os.stat(self._log_file)
+        except FileNotFoundError:
+            st = None
+        if st is None or (st.st_dev, st.st_ino) != self._identity:
+            # Already rotated by another writer: keep its .jsonl.1 and let
+            # the next open read the size of the fresh file
+            self.close()
+            return
+
+        self._size = st.st_size
+        if self._size > self._max_log_size:
+            # Release the handle first so the next event opens the fresh file
+            self.close()
             rotated = self._log_file.with_suffix(".jsonl.1")
             if rotated.exists():
                 rotated.unlink()
@@ -55,14 +144,27 @@ class TelemetryClient:
             return
 
         try:
-            self._log_dir.mkdir(parents=True, exist_ok=True)
+            self._open()
             self._rotate_if_needed()
 
             record: Dict[str, Any] = {
                 "timestamp": datetime.now(tz=UTC).isoformat(),
                 **kwargs,
             }
-            with open(self._log_file, "a") as fh:
-                fh.write(json.dumps(record) + "\n")
+            line = _dumps(record) + "\n"
+            # The handle was checked above; only reopen after a rotation
+            fh = self._fh if self._fh is not None else self._open()
+            fh.write(line)
+            # One write syscall per event; nothing is lost if the process dies
+            fh.flush()
+            self._size += len(line.encode("utf-8"))
         except OSError as exc:
             raise FabricTelemetryError(f"Failed to write telemetry: {exc}") from exc
+
+    def close(self) -> None:
+        """Flush and close the log file handle, if open."""
+        if self._fh is not None:
+            self._fh = None
+            self._identity = None
+            # Runs fh.close() once and detaches it from garbage collection
+            self._closer()
@@ -10,8 +10,10 @@ Sandboxed execution prevents arbitrary code execution in templates.
 
 import json
 import logging
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from jinja2 import (
     FileSystemLoader,
@@ -24,6 +26,32 @@ from jinja2 import (
 
 logger = logging.getLogger(__name__)
 
+# Variable value types whose rendering is fully determined by their value, so
+# render_string output can be memoised on (template, variables)
+_MEMOIZABLE_TYPES = (str, int, float, bool, type(None))
+
+# Rendered outputs kept per engine
+_RENDER_CACHE_SIZE = 256
+
+# Compiled templates kept per engine
+_COMPILE_CACHE_SIZE = 512
+
+# Jinja2 variable syntax: {{ variable_name }}
+_TEMPLATE_VARIABLE_RE = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_\.]*)\s*\}\}")
+
+
+def _render_cache_key(
+    variables: Dict[str, Any],
+) -> Optional[Tuple[Tuple[str, type, Any], ...]]:
+    """Hashable key for ``variables``, or None if any value is not a scalar.
+
+    The value type is part of the key because 1, 1.0 and True hash alike but
+    render differently.
+    """
+    if not all(type(v) in _MEMOIZABLE_TYPES for v in variables.values()):
+        return None
+    return tuple(sorted((k, type(v), v) for k, v in variables.items()))
+
 
 class ArtifactTemplateEngine:
     """
@@ -66,6 +94,22 @@ class ArtifactTemplateEngine:
         self.env.filters["upper"] = str.upper
         self.env.filters["lower"] = str.lower
 
+        # Memoise rendered output for scalar-only variable sets; the same
+        # template is typically rendered repeatedly with the same values
+        self._render_memo = lru_cache(maxsize=_RENDER_CACHE_SIZE)(self._render)
+
+        # Compiled Template per source string: lexing, parsing and code
+        # generation happen once, later renders only execute the template
+        self._compile = lru_cache(maxsize=_COMPILE_CACHE_SIZE)(self.env.from_string)
+
+    def _render(
+        self, template_string: str, key: Tuple[Tuple[str, type, Any], ...]
+    ) -> str:
+        """Render ``template_string`` with variables rebuilt from a cache key."""
+        return self._compile(template_string).render(
+            **{name: value for name, _, value in key}
+        )
+
     def render_string(
         self,
         template_string: str,
@@ -84,14 +128,16 @@ class ArtifactTemplateEngine:
             Rendered string or validation result
         """
         try:
-            template = self.env.from_string(template_string)
-
             if validate_only:
                 # Just validate syntax
+                self._compile(template_string)
                 return True
 
-            rendered = template.render(**variables)
-            return rendered
+            key = _render_cache_key(variables)
+            if key is not None:
+                return self._render_memo(template_string, key)
+
+            return self._compile(template_string).render(**variables)
 
         except TemplateSyntaxError as e:
             logger.error("Template syntax error: %s", e)
@@ -159,9 +205,11 @@ class ArtifactTemplateEngine:
         Returns:
             Rendered JSON as dictionary
         """
-        # Convert to string if dict
+        # Convert to string if dict; the whole document is rendered in a single
+        # Jinja pass. Compact separators since the layout is discarded by
+        # json.loads anyway and a shorter source lexes faster.
         if isinstance(json_template, dict):
-            template_string = json.dumps(json_template, indent=2)
+            template_string = json.dumps(json_template, separators=(",", ":"))
         else:
             template_string = json_template
 
@@ -214,7 +262,8 @@ class ArtifactTemplateEngine:
         """
         Extract variable names from a template string.
 
-        Useful for validation and documentation.
+        Useful for validation and documentation. Results are memoised per
+        template string.
 
         Args:
             template_string: Jinja2 template string
@@ -222,15 +271,21 @@ class ArtifactTemplateEngine:
         Returns:
             List of variable names found in template
         """
-        import re
+        return list(_extract_template_variables(template_string))
 
-        # Match Jinja2 variable syntax: {{ variable_name }}
-        pattern = r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_\.]*)\s*\}\}"
-        matches = re.findall(pattern, template_string)
 
-        # Remove duplicates and sort
-        unique_vars = sorted(set(matches))
-        return unique_vars
+@lru_cache(maxsize=512)
+def _extract_template_variables(template_string: str) -> Tuple[str, ...]:
+    """Sorted, de-duplicated variable names; a tuple so the cache stays immutable."""
+    return tuple(sorted(set(_TEMPLATE_VARIABLE_RE.findall(template_string))))
+
+
+def _load_json_template(source: Union[Path, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return an artifact template, reading it from disk unless already parsed."""
+    if isinstance(source, dict):
+        return source
+    with open(source, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
 class FabricArtifactTemplater:
@@ -250,7 +305,10 @@ class FabricArtifactTemplater:
         self.engine = template_engine or ArtifactTemplateEngine()
 
     def render_notebook(
-        self, notebook_path: Path, variables: Dict[str, Any], output_path: Path
+        self,
+        notebook_path: Union[Path, Dict[str, Any]],
+        variables: Dict[str, Any],
+        output_path: Path,
     ) -> Dict[str, Any]:
         """
         Render a Fabric Notebook with environment-specific values.
@@ -258,7 +316,7 @@ class FabricArtifactTemplater:
         Notebooks are JSON files with embedded code cells.
 
         Args:
-            notebook_path: Path to notebook template
+            notebook_path: Path to notebook template, or the parsed template dict
             variables: Variables to inject
             output_path: Where to save rendered notebook
 
@@ -267,9 +325,8 @@ class FabricArtifactTemplater:
         """
         logger.info("Rendering notebook: %s", notebook_path)
 
-        # Read notebook
-        with open(notebook_path, "r", encoding="utf-8") as f:
-            notebook_template = json.load(f)
+        # Read notebook (skipped when the caller passes a parsed dict)
+        notebook_template = _load_json_template(notebook_path)
 
         # Render
         rendered_notebook = self.engine.render_json(notebook_template, variables)
@@ -283,13 +340,17 @@ class FabricArtifactTemplater:
         return rendered_notebook
 
     def render_lakehouse_definition(
-        self, definition_path: Path, variables: Dict[str, Any], output_path: Path
+        self,
+        definition_path: Union[Path, Dict[str, Any]],
+        variables: Dict[str, Any],
+        output_path: Path,
     ) -> Dict[str, Any]:
         """
         Render a Lakehouse definition with environment-specific values.
 
         Args:
-            definition_path: Path to lakehouse definition template
+            definition_path: Path to lakehouse definition template, or the
+                parsed template dict
             variables: Variables to inject
             output_path: Where to save rendered definition
 
@@ -298,9 +359,8 @@ class FabricArtifactTemplater:
         """
         logger.info("Rendering lakehouse definition: %s", definition_path)
 
-        # Read definition
-        with open(definition_path, "r", encoding="utf-8") as f:
-            definition_template = json.load(f)
+        # Read definition (skipped when the caller passes a parsed dict)
+        definition_template = _load_json_template(definition_path)
 
         # Render
         rendered_definition = self.engine.render_json(definition_template, variables)
@@ -314,13 +374,16 @@ class FabricArtifactTemplater:
         return rendered_definition
 
     def render_pipeline(
-        self, pipeline_path: Path, variables: Dict[str, Any], output_path: Path
+        self,
+        pipeline_path: Union[Path, Dict[str, Any]],
+        variables: Dict[str, Any],
+        output_path: Path,
     ) -> Dict[str, Any]:
         """
         Render a Data Pipeline definition with environment-specific values.
 
         Args:
-            pipeline_path: Path to pipeline template
+            pipeline_path: Path to pipeline template, or the parsed template dict
             variables: Variables to inject
             output_path: Where to save rendered pipeline
 
@@ -329,9 +392,8 @@ class FabricArtifactTemplater:
         """
         logger.info("Rendering pipeline: %s", pipeline_path)
 
-        # Read pipeline
-        with open(pipeline_path, "r", encoding="utf-8") as f:
-            pipeline_template = json.load(f)
+        # Read pipeline (skipped when the caller passes a parsed dict)
+        pipeline_template = _load_json_template(pipeline_path)
 
         # Render
         rendered_pipeline = self.engine.render_json(pipeline_template, variables)
@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
+import copy
+import importlib
+import json
+import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any, Tuple
+
+import pytest
+import yaml
+
+_YAML_CACHE_MAX = 100
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
@@ -12,3 +25,86 @@ for path in (PROJECT_ROOT, SRC_PATH):
     str_path = str(path)
     if str_path not in sys.path:
         sys.path.insert(0, str_path)
+
+
+@pytest.fixture(scope="session")
+def onboard_mod():
+    """The onboard script module, imported once per test session."""
+    return importlib.import_module("usf_fabric_cli.scripts.dev.onboard")
+
+
+@pytest.fixture(scope="session")
+def env_snapshots():
+    """Prebuilt credential environments, swapped in whole as ``os.environ``.
+
+    Tests install one with ``monkeypatch.setattr(os, "environ", snap.copy())``
+    instead of issuing a setenv/delenv per variable.
+    """
+    return {
+        "sp": {
+            "AZURE_CLIENT_ID": "test-client-id",
+            "AZURE_CLIENT_SECRET": "test-secret",
+            "TENANT_ID": "test-tenant",
+        },
+        "token": {"FABRIC_TOKEN": "test-token"},
+        "github": {"GITHUB_TOKEN": "test-github-token"},
+        "ado": {"AZURE_DEVOPS_PAT": "test-ado-pat"},
+        "empty": {},
+    }
+
+
+def _load_yaml_via_sidecar(path: str, yaml_mtime_ns: int) -> Any:
+    """Parse ``path``, preferring an up-to-date ``<path>.json`` sidecar.
+
+    JSON decoding is much cheaper than PyYAML, so the first parse of a
+    file writes its result next to it and later runs read that instead
+    until the YAML is modified. Sidecars are only written when the data
+    survives a JSON round trip unchanged (no dates, non-string keys, ...).
+    """
+    sidecar = f"{path}.json"
+    try:
+        if os.stat(sidecar).st_mtime_ns >= yaml_mtime_ns:
+            with open(sidecar, encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with open(path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)  # nosec B506 - safe loader
+
+    try:
+        encoded = json.dumps(data)
+        if json.loads(encoded) == data:
+            with open(sidecar, "w", encoding="utf-8") as f:
+                f.write(encoded)
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
+def _load_yaml_cached(path) -> Any:
+    """Parse a YAML file, reusing the previous parse while mtime/size match.
+
+    Callers get a deep copy so mutating the result cannot leak into other
+    tests sharing the cache entry.
+    """
+    key = os.fspath(path)
+    stat = os.stat(key)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    data = _load_yaml_via_sidecar(key, stat.st_mtime_ns)
+
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+@pytest.fixture
+def load_yaml():
+    """Load YAML through the session-wide mtime-keyed parse cache."""
+    return _load_yaml_cached
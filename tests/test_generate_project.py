@@ -3,7 +3,6 @@
 from pathlib import Path
 
 import pytest
-import yaml
 
 from usf_fabric_cli.scripts.dev.generate_project import generate_project_config
 
@@ -11,7 +10,7 @@ from usf_fabric_cli.scripts.dev.generate_project import generate_project_config
 class TestGenerateProjectConfig:
     """Tests for the generate_project_config function."""
 
-    def test_output_is_valid_yaml(self, tmp_path, monkeypatch):
+    def test_output_is_valid_yaml(self, tmp_path, monkeypatch, load_yaml):
         """Generated config should be valid YAML."""
         monkeypatch.chdir(tmp_path)
 
@@ -25,11 +24,12 @@ class TestGenerateProjectConfig:
         assert result is not None
         output = Path(result)
         assert output.exists()
-        with output.open() as f:
-            parsed = yaml.safe_load(f)
+        parsed = load_yaml(output)
         assert isinstance(parsed, dict)
 
-    def test_deployment_pipeline_section_present(self, tmp_path, monkeypatch):
+    def test_deployment_pipeline_section_present(
+        self, tmp_path, monkeypatch, load_yaml
+    ):
         """Generated config should include deployment_pipeline."""
         monkeypatch.chdir(tmp_path)
 
@@ -41,14 +41,13 @@ class TestGenerateProjectConfig:
         )
 
         output = Path(result)
-        with output.open() as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(output)
 
         assert "deployment_pipeline" in config
         pipeline = config["deployment_pipeline"]
         assert "stages" in pipeline
 
-    def test_workspace_section_present(self, tmp_path, monkeypatch):
+    def test_workspace_section_present(self, tmp_path, monkeypatch, load_yaml):
         """Generated config should have a workspace section."""
         monkeypatch.chdir(tmp_path)
 
@@ -60,13 +59,12 @@ class TestGenerateProjectConfig:
         )
 
         output = Path(result)
-        with output.open() as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(output)
 
         assert "workspace" in config
         assert "name" in config["workspace"]
 
-    def test_org_name_in_workspace(self, tmp_path, monkeypatch):
+    def test_org_name_in_workspace(self, tmp_path, monkeypatch, load_yaml):
         """Org name should appear in workspace naming."""
         monkeypatch.chdir(tmp_path)
 
@@ -78,8 +76,7 @@ class TestGenerateProjectConfig:
         )
 
         output = Path(result)
-        with output.open() as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(output)
 
         ws_name = config["workspace"]["name"]
         assert "acme" in ws_name.lower()
@@ -10,116 +10,171 @@ Tests verify:
 - Workspace-to-Git connection
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 import pytest
+from git.util import IterableList
 
+from usf_fabric_cli.services.fabric_wrapper import FabricCLIWrapper
 from usf_fabric_cli.services.git_integration import GitFabricIntegration
 
 
-class TestGetWorkspaceNameFromBranch:
-    """Tests for workspace name derivation from branch names."""
-
-    def setup_method(self):
-        self.git = GitFabricIntegration(fabric_wrapper=MagicMock())
-
-    def test_main_returns_base_name(self):
-        """Main branch returns base workspace name unchanged."""
-        result = self.git.get_workspace_name_from_branch("my-workspace", "main")
-        assert result == "my-workspace"
-
-    def test_master_returns_base_name(self):
-        """Master branch returns base workspace name unchanged."""
-        result = self.git.get_workspace_name_from_branch("my-workspace", "master")
-        assert result == "my-workspace"
-
-    # ── Slug-style names (no spaces) → hyphen notation ──
-
-    def test_slug_feature_branch_appends_sanitized_suffix(self):
-        """Slug-style names: feature branches append a sanitized branch name."""
-        result = self.git.get_workspace_name_from_branch(
-            "my-workspace", "feature/add-auth"
-        )
-        assert result == "my-workspace-feature-add-auth"
-
-    def test_slug_underscores_replaced_with_hyphens(self):
-        """Slug-style names: underscores replaced with hyphens."""
-        result = self.git.get_workspace_name_from_branch("ws", "fix_bug_123")
-        assert result == "ws-fix-bug-123"
-
-    def test_slug_branch_name_lowercased(self):
-        """Slug-style names: branch names should be lowercased."""
-        result = self.git.get_workspace_name_from_branch("ws", "Feature/MyFeature")
-        assert result == "ws-feature-myfeature"
-
-    def test_slug_nested_branch_slashes_replaced(self):
-        """Slug-style names: multi-segment feature branch strips project slug."""
-        result = self.git.get_workspace_name_from_branch("ws", "feature/team/auth")
-        assert result == "ws-feature-auth"
-
-    def test_display_name_opco_data_mart_no_duplication(self):
-        """Display names: real-world sc30gld project produces clean name."""
-        result = self.git.get_workspace_name_from_branch(
-            "SC30GLD-DM30 - Opco Data Mart",
-            "feature/sc30gld_dm30_opco_data_mart/test-access",
-        )
-        assert result == ("[F] SC30GLD-DM30 - Opco Data Mart [FEATURE-test-access]")
-
-    # ── Display-style names (contain spaces) → bracket notation ──
-
-    def test_display_name_uses_bracket_notation(self):
-        """Display names: use [F] prefix + [FEATURE-<desc>] bracket notation."""
-        result = self.git.get_workspace_name_from_branch(
-            "Sales Report", "feature/fix-bug"
-        )
-        assert result == "[F] Sales Report [FEATURE-fix-bug]"
-
-    def test_display_name_strips_existing_env_tag(self):
-        """Display names: strip existing [DEV] tag before appending."""
-        result = self.git.get_workspace_name_from_branch(
-            "Sales Report [DEV]", "feature/add-chart"
-        )
-        assert result == "[F] Sales Report [FEATURE-add-chart]"
-
-    def test_display_name_nested_feature_branch(self):
-        """Display names: multi-segment feature branch strips project slug."""
-        result = self.git.get_workspace_name_from_branch(
-            "RE Sales - Direct Sales Helicopter View",
-            "feature/re_sales_direct/dev-setup",
-        )
-        assert result == (
-            "[F] RE Sales - Direct Sales Helicopter View " "[FEATURE-dev-setup]"
-        )
-
-    def test_display_name_non_feature_branch(self):
-        """Display names: non-feature branches use dashes in bracket."""
-        result = self.git.get_workspace_name_from_branch(
-            "My Project Workspace", "hotfix/urgent-fix"
-        )
-        assert result == "[F] My Project Workspace [FEATURE-hotfix-urgent-fix]"
+@pytest.fixture(scope="class")
+def git():
+    """Shared integration for tests that only exercise pure methods."""
+    return GitFabricIntegration(
+        fabric_wrapper=create_autospec(FabricCLIWrapper, instance=True)
+    )
+
+
+@pytest.fixture
+def git_with_run(monkeypatch):
+    """Integration whose ``git ls-remote`` probe always succeeds."""
+    monkeypatch.setattr("subprocess.run", lambda *a, **k: Mock(returncode=0))
+    return GitFabricIntegration(fabric_wrapper=Mock())
+
+
+def make_repo(
+    *,
+    branch="main",
+    dirty=False,
+    heads=(),
+    remote_url="https://github.com/org/repo",
+):
+    """Build a lightweight stand-in for ``git.Repo``.
+
+    ``heads`` is a GitPython ``IterableList`` so membership and item
+    lookup by branch name behave as they do on a real repository.
+    """
+    repo = Mock(
+        spec_set=[
+            "active_branch",
+            "is_dirty",
+            "remote",
+            "heads",
+            "create_head",
+            "head",
+            "git",
+        ]
+    )
+    repo.active_branch.name = branch
+    repo.is_dirty.return_value = dirty
+    repo.remote.return_value.url = remote_url
+    repo.remote.return_value.refs = []
+    repo.heads = IterableList("name")
+    for head_name in heads:
+        head = Mock(spec_set=["name", "checkout"])
+        head.name = head_name
+        repo.heads.append(head)
+    return repo
 
-    # ── Feature prefix customization ──
 
-    def test_custom_feature_prefix(self):
-        """Display names: custom ASCII prefix replaces default [F]."""
-        result = self.git.get_workspace_name_from_branch(
-            "Sales Report", "feature/fix-bug", feature_prefix=">>"
-        )
-        assert result == ">> Sales Report [FEATURE-fix-bug]"
-
-    def test_empty_feature_prefix_disables_prefix(self):
-        """Display names: empty string disables the prefix entirely."""
-        result = self.git.get_workspace_name_from_branch(
-            "Sales Report", "feature/fix-bug", feature_prefix=""
-        )
-        assert result == "Sales Report [FEATURE-fix-bug]"
+class TestGetWorkspaceNameFromBranch:
+    """Tests for workspace name derivation from branch names."""
 
-    def test_slug_names_never_get_prefix(self):
-        """Slug-style names: never get a prefix (slug path always used)."""
-        result = self.git.get_workspace_name_from_branch(
-            "my-workspace", "feature/add-auth", feature_prefix="[F]"
-        )
-        assert result == "my-workspace-feature-add-auth"
+    @pytest.mark.parametrize(
+        "base,branch,kwargs,expected",
+        [
+            # Main/master return the base workspace name unchanged
+            pytest.param(
+                "my-workspace", "main", {}, "my-workspace", id="main_base_name"
+            ),
+            pytest.param(
+                "my-workspace", "master", {}, "my-workspace", id="master_base_name"
+            ),
+            # ── Slug-style names (no spaces) → hyphen notation ──
+            pytest.param(
+                "my-workspace",
+                "feature/add-auth",
+                {},
+                "my-workspace-feature-add-auth",
+                id="slug_feature_sanitized_suffix",
+            ),
+            pytest.param(
+                "ws",
+                "fix_bug_123",
+                {},
+                "ws-fix-bug-123",
+                id="slug_underscores_to_hyphens",
+            ),
+            pytest.param(
+                "ws",
+                "Feature/MyFeature",
+                {},
+                "ws-feature-myfeature",
+                id="slug_lowercased",
+            ),
+            # Multi-segment feature branch strips the project slug
+            pytest.param(
+                "ws",
+                "feature/team/auth",
+                {},
+                "ws-feature-auth",
+                id="slug_nested_branch",
+            ),
+            # ── Display-style names (contain spaces) → bracket notation ──
+            pytest.param(
+                "SC30GLD-DM30 - Opco Data Mart",
+                "feature/sc30gld_dm30_opco_data_mart/test-access",
+                {},
+                "[F] SC30GLD-DM30 - Opco Data Mart [FEATURE-test-access]",
+                id="display_opco_data_mart_no_duplication",
+            ),
+            pytest.param(
+                "Sales Report",
+                "feature/fix-bug",
+                {},
+                "[F] Sales Report [FEATURE-fix-bug]",
+                id="display_bracket_notation",
+            ),
+            pytest.param(
+                "Sales Report [DEV]",
+                "feature/add-chart",
+                {},
+                "[F] Sales Report [FEATURE-add-chart]",
+                id="display_strips_env_tag",
+            ),
+            pytest.param(
+                "RE Sales - Direct Sales Helicopter View",
+                "feature/re_sales_direct/dev-setup",
+                {},
+                "[F] RE Sales - Direct Sales Helicopter View [FEATURE-dev-setup]",
+                id="display_nested_feature_branch",
+            ),
+            pytest.param(
+                "My Project Workspace",
+                "hotfix/urgent-fix",
+                {},
+                "[F] My Project Workspace [FEATURE-hotfix-urgent-fix]",
+                id="display_non_feature_branch",
+            ),
+            # ── Feature prefix customization ──
+            pytest.param(
+                "Sales Report",
+                "feature/fix-bug",
+                {"feature_prefix": ">>"},
+                ">> Sales Report [FEATURE-fix-bug]",
+                id="custom_feature_prefix",
+            ),
+            pytest.param(
+                "Sales Report",
+                "feature/fix-bug",
+                {"feature_prefix": ""},
+                "Sales Report [FEATURE-fix-bug]",
+                id="empty_prefix_disables_prefix",
+            ),
+            pytest.param(
+                "my-workspace",
+                "feature/add-auth",
+                {"feature_prefix": "[F]"},
+                "my-workspace-feature-add-auth",
+                id="slug_never_prefixed",
+            ),
+        ],
+    )
+    def test_workspace_name(self, git, base, branch, kwargs, expected):
+        """Branch names map onto slug or bracket-style workspace names."""
+        assert git.get_workspace_name_from_branch(base, branch, **kwargs) == expected
 
 
 class TestWorkspaceNameValidation:
@@ -192,16 +247,14 @@ class TestInitializeRepo:
     """Tests for Git repository initialization."""
 
     def setup_method(self):
-        self.git = GitFabricIntegration(fabric_wrapper=MagicMock())
+        self.git = GitFabricIntegration(
+            fabric_wrapper=create_autospec(FabricCLIWrapper, instance=True)
+        )
 
     @patch("usf_fabric_cli.services.git_integration.Repo")
     def test_valid_repo(self, mock_repo_class):
         """Should return success with repository info."""
-        mock_repo = MagicMock()
-        mock_repo.active_branch.name = "main"
-        mock_repo.is_dirty.return_value = False
-        mock_repo.remote.return_value.url = "https://github.com/org/repo"
-        mock_repo_class.return_value = mock_repo
+        mock_repo_class.return_value = make_repo()
 
         result = self.git.initialize_repo("/valid/path")
 
@@ -227,7 +280,9 @@ class TestValidateBranch:
     """Tests for branch validation."""
 
     def setup_method(self):
-        self.git = GitFabricIntegration(fabric_wrapper=MagicMock())
+        self.git = GitFabricIntegration(
+            fabric_wrapper=create_autospec(FabricCLIWrapper, instance=True)
+        )
 
     def test_no_repo_initialized(self):
         """Should fail if repo is not initialized."""
@@ -237,12 +292,7 @@ class TestValidateBranch:
 
     def test_branch_exists_locally(self):
         """Should detect locally available branches."""
-        mock_repo = MagicMock()
-        mock_head = MagicMock()
-        mock_head.name = "main"
-        mock_repo.heads = [mock_head]
-        mock_repo.remote.return_value.refs = []
-        self.git.repo = mock_repo
+        self.git.repo = make_repo(heads=["main"])
 
         result = self.git.validate_branch("main")
         assert result["success"] is True
@@ -251,10 +301,7 @@ class TestValidateBranch:
 
     def test_branch_not_found(self):
         """Should report branch not available."""
-        mock_repo = MagicMock()
-        mock_repo.heads = []
-        mock_repo.remote.return_value.refs = []
-        self.git.repo = mock_repo
+        self.git.repo = make_repo()
 
         result = self.git.validate_branch("nonexistent")
         assert result["success"] is True
@@ -264,55 +311,36 @@ class TestValidateBranch:
 class TestValidateGitRepoUrl:
     """Tests for Git repository URL validation."""
 
-    def setup_method(self):
-        self.git = GitFabricIntegration(fabric_wrapper=MagicMock())
-
-    @patch("subprocess.run")
-    def test_github_https_url(self, mock_run):
-        """Should accept GitHub HTTPS URLs."""
-        mock_run.return_value = Mock(returncode=0)
-
-        result = self.git._validate_git_repo_url("https://github.com/org/repo")
-        assert result["success"] is True
-
-    @patch("subprocess.run")
-    def test_ado_https_url(self, mock_run):
-        """Should accept Azure DevOps HTTPS URLs."""
-        mock_run.return_value = Mock(returncode=0)
-        ado_url = "https://dev.azure.com/org/proj/_git/repo"
-        result = self.git._validate_git_repo_url(ado_url)
-        assert result["success"] is True
-
-    def test_invalid_url_format(self):
-        """Should reject unsupported URL formats."""
-        result = self.git._validate_git_repo_url("https://gitlab.com/org/repo")
-        assert result["success"] is False
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://github.com/org/repo", True),
+            ("https://dev.azure.com/org/proj/_git/repo", True),
+            ("git@github.com:org/repo", True),
+            ("https://gitlab.com/org/repo", False),
+            ("", False),
+            (None, False),
+        ],
+        ids=["github_https", "ado_https", "github_ssh", "gitlab", "empty", "none"],
+    )
+    def test_url_validation(self, git_with_run, url, expected):
+        """Only GitHub and Azure DevOps URLs are accepted."""
+        result = git_with_run._validate_git_repo_url(url)
+        assert result["success"] is expected
+
+    def test_invalid_url_format_reports_unsupported(self, git):
+        """Should explain why an unsupported host was rejected."""
+        result = git._validate_git_repo_url("https://gitlab.com/org/repo")
         assert "Unsupported" in result["error"]
 
-    def test_empty_url(self):
-        """Should reject empty URLs."""
-        result = self.git._validate_git_repo_url("")
-        assert result["success"] is False
-
-    def test_none_url(self):
-        """Should reject None URLs."""
-        result = self.git._validate_git_repo_url(None)
-        assert result["success"] is False
-
-    @patch("subprocess.run")
-    def test_github_ssh_url(self, mock_run):
-        """Should accept GitHub SSH URLs."""
-        mock_run.return_value = Mock(returncode=0)
-
-        result = self.git._validate_git_repo_url("git@github.com:org/repo")
-        assert result["success"] is True
-
 
 class TestCreateFeatureBranch:
     """Tests for feature branch creation."""
 
     def setup_method(self):
-        self.git = GitFabricIntegration(fabric_wrapper=MagicMock())
+        self.git = GitFabricIntegration(
+            fabric_wrapper=create_autospec(FabricCLIWrapper, instance=True)
+        )
 
     def test_no_repo_initialized(self):
         """Should fail if repo is not initialized."""
@@ -322,24 +350,19 @@ class TestCreateFeatureBranch:
 
     def test_existing_branch_checkout(self):
         """Should checkout existing branch instead of creating."""
-        mock_repo = MagicMock()
-        mock_branch = MagicMock()
-        mock_heads = MagicMock()
-        mock_heads.__contains__ = MagicMock(return_value=True)
-        mock_heads.__getitem__ = MagicMock(return_value=mock_branch)
-        mock_repo.heads = mock_heads
+        mock_repo = make_repo(heads=["feature/test"])
         self.git.repo = mock_repo
 
         result = self.git.create_feature_branch("feature/test")
         assert result["success"] is True
         assert "existing" in result["message"].lower()
+        mock_repo.heads["feature/test"].checkout.assert_called_once()
+        mock_repo.create_head.assert_not_called()
 
     def test_new_branch_creation(self):
         """Should create and checkout a new branch."""
-        mock_repo = MagicMock()
-        mock_repo.heads = MagicMock()
-        mock_repo.heads.__contains__ = MagicMock(return_value=False)
-        new_branch = MagicMock()
+        mock_repo = make_repo(heads=["main"])
+        new_branch = Mock(spec_set=["checkout"])
         mock_repo.create_head.return_value = new_branch
         self.git.repo = mock_repo
 
@@ -353,7 +376,7 @@ class TestConnectWorkspaceToGit:
     """Tests for workspace-to-Git connection."""
 
     def setup_method(self):
-        self.mock_fabric = MagicMock()
+        self.mock_fabric = create_autospec(FabricCLIWrapper, instance=True)
         self.git = GitFabricIntegration(fabric_wrapper=self.mock_fabric)
 
     def test_invalid_url_stops_connection(self):
@@ -370,7 +393,7 @@ class TestSyncWorkspaceWithGit:
     """Tests for workspace-Git sync."""
 
     def setup_method(self):
-        self.mock_fabric = MagicMock()
+        self.mock_fabric = create_autospec(FabricCLIWrapper, instance=True)
         self.git = GitFabricIntegration(fabric_wrapper=self.mock_fabric)
 
     def test_sync_success(self):
@@ -393,7 +416,9 @@ class TestGetCurrentGitInfo:
     """Tests for getting current Git info."""
 
     def setup_method(self):
-        self.git = GitFabricIntegration(fabric_wrapper=MagicMock())
+        self.git = GitFabricIntegration(
+            fabric_wrapper=create_autospec(FabricCLIWrapper, instance=True)
+        )
 
     def test_no_repo(self):
         """Should return error if repo not initialized."""
@@ -403,12 +428,9 @@ class TestGetCurrentGitInfo:
 
     def test_with_repo(self):
         """Should return full repo information."""
-        mock_repo = MagicMock()
-        mock_repo.active_branch.name = "main"
-        mock_repo.is_dirty.return_value = True
-        mock_repo.remote.return_value.url = "https://github.com/org/repo"
+        mock_repo = make_repo(dirty=True)
 
-        mock_commit = MagicMock()
+        mock_commit = Mock()
         mock_commit.hexsha = "abcdef1234567890"
         mock_commit.message = "test commit"
         mock_commit.author = "Test Author"
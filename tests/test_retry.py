@@ -6,17 +6,19 @@ Tests verify:
 - HTTP status code classification
 - Exception retryability
 - Exponential backoff calculation
-- Retry decorator behavior
+- Retry decorator behavior (sync and async)
 - Retry request convenience function
 """
 
+import asyncio
 import random
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import requests
 
 from usf_fabric_cli.utils.retry import (
+    aretry_with_backoff,
     calculate_backoff,
     is_retryable_error,
     is_retryable_exception,
@@ -26,6 +28,16 @@ from usf_fabric_cli.utils.retry import (
 )
 
 
+class FakeResponse:
+    """Minimal stand-in for requests.Response; far cheaper than a MagicMock."""
+
+    __slots__ = ("status_code", "raise_for_status")
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.raise_for_status = lambda: None
+
+
 class TestIsRetryableError:
     """Tests for error message pattern matching."""
 
@@ -85,23 +97,42 @@ class TestIsRetryableHttpStatus:
         """Other status codes should NOT be retryable."""
         assert is_retryable_http_status(code) is False
 
+    @pytest.mark.parametrize("code", [None, "503", 503.0, -1, 1000])
+    def test_unexpected_status_codes(self, code):
+        """Non-int or out-of-range status codes are not retryable."""
+        assert is_retryable_http_status(code) is False
+
 
 class TestIsRetryableException:
     """Tests for exception retryability classification."""
 
-    def test_http_error_429(self):
-        """HTTPError with 429 should be retryable."""
-        response = MagicMock()
-        response.status_code = 429
-        exc = requests.exceptions.HTTPError(response=response)
-        assert is_retryable_exception(exc) is True
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            pytest.param(429, True, id="rate-limited"),
+            pytest.param(401, True, id="token-refresh"),
+            pytest.param(403, False, id="forbidden"),
+            pytest.param(500, False, id="server-error"),
+        ],
+    )
+    def test_http_error_status(self, status, expected):
+        """HTTPError retryability follows the response status code."""
+        exc = requests.exceptions.HTTPError(response=FakeResponse(status))
+        assert is_retryable_exception(exc) is expected
+
+    def test_http_error_non_int_status(self):
+        """A response with a non-int status code does not break classification."""
+        exc = requests.exceptions.HTTPError(response=FakeResponse("503"))
+        assert is_retryable_exception(exc) is False
 
-    def test_http_error_401(self):
-        """HTTPError with 401 should be retryable (token refresh)."""
-        response = MagicMock()
-        response.status_code = 401
-        exc = requests.exceptions.HTTPError(response=response)
-        assert is_retryable_exception(exc) is True
+    def test_http_error_status_wins_over_message(self):
+        """With a response attached, the status code decides; str() is not used."""
+        exc = requests.exceptions.HTTPError(
+            "503 Service Unavailable", response=FakeResponse(403)
+        )
+        with patch("usf_fabric_cli.utils.retry.is_retryable_error") as mock_match:
+            assert is_retryable_exception(exc) is False
+        mock_match.assert_not_called()
 
     def test_connection_error(self):
         """ConnectionError should be retryable."""
@@ -165,6 +196,39 @@ class TestCalculateBackoff:
             delay = calculate_backoff(attempt)
             assert delay >= 0
 
+    def test_negative_attempt_uses_base_delay(self):
+        """A negative attempt number is clamped rather than raising."""
+        delay = calculate_backoff(-1, base_delay=2.0, max_delay=100.0, jitter=False)
+        assert delay == 2.0
+
+    def test_decorrelated_bounded_by_max_delay(self):
+        """Decorrelated delays grow from base_delay but never exceed max_delay."""
+        random.seed(42)
+        delay = None
+        for attempt in range(20):
+            delay = calculate_backoff(
+                attempt,
+                base_delay=1.0,
+                max_delay=30.0,
+                mode="decorrelated",
+                prev_delay=delay,
+            )
+            assert 1.0 <= delay <= 30.0
+
+    def test_decorrelated_upper_bound_from_prev_delay(self):
+        """Each decorrelated delay is at most three times the previous one."""
+        random.seed(0)
+        for _ in range(50):
+            delay = calculate_backoff(
+                0, base_delay=1.0, max_delay=100.0, mode="decorrelated", prev_delay=4.0
+            )
+            assert 1.0 <= delay <= 12.0
+
+    def test_unknown_mode_rejected(self):
+        """An unknown backoff mode should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown backoff mode"):
+            calculate_backoff(0, mode="linear")
+
 
 class TestRetryWithBackoff:
     """Tests for the retry_with_backoff decorator."""
@@ -198,6 +262,39 @@ class TestRetryWithBackoff:
         assert flaky() == "ok"
         assert call_count == 3
 
+    @patch("usf_fabric_cli.utils.retry.calculate_backoff", return_value=0.0)
+    @patch("usf_fabric_cli.utils.retry.time.sleep")
+    def test_final_attempt_skips_backoff_and_callback(self, mock_sleep, mock_backoff):
+        """The last failure is re-raised without backoff, sleep or on_retry."""
+        on_retry = MagicMock()
+        check = MagicMock(return_value=True)
+        func = MagicMock(side_effect=RuntimeError("503"))
+        wrapped = retry_with_backoff(
+            max_retries=2, retryable_check=check, on_retry=on_retry
+        )(func)
+
+        with pytest.raises(RuntimeError):
+            wrapped()
+        assert func.call_count == 3
+        assert mock_backoff.call_count == 2
+        assert mock_sleep.call_count == 2
+        assert on_retry.call_count == 2
+        assert check.call_count == 2
+
+    @patch("usf_fabric_cli.utils.retry.calculate_backoff", return_value=0.5)
+    @patch("usf_fabric_cli.utils.retry.time.sleep")
+    def test_decorrelated_threads_prev_delay(self, mock_sleep, mock_backoff):
+        """Decorrelated mode passes each delay into the next backoff call."""
+        func = MagicMock(side_effect=[RuntimeError("503"), RuntimeError("503"), "ok"])
+        wrapped = retry_with_backoff(max_retries=3, backoff_mode="decorrelated")(func)
+
+        assert wrapped() == "ok"
+        prev_delays = [c.kwargs["prev_delay"] for c in mock_backoff.call_args_list]
+        assert prev_delays == [None, 0.5]
+        assert all(
+            c.kwargs["mode"] == "decorrelated" for c in mock_backoff.call_args_list
+        )
+
     @patch("usf_fabric_cli.utils.retry.time.sleep")
     def test_exhausts_retries(self, mock_sleep):
         """Should raise after exhausting all retries."""
@@ -285,15 +382,99 @@ class TestRetryWithBackoff:
         assert call_count == 2
 
 
+class TestAsyncRetryWithBackoff:
+    """Tests for the aretry_with_backoff decorator."""
+
+    def test_success_first_try(self):
+        """Coroutine succeeding on first try should not retry."""
+        call_count = 0
+
+        @aretry_with_backoff(max_retries=3)
+        async def succeed():
+            nonlocal call_count
+            call_count += 1
+            return "ok"
+
+        assert asyncio.run(succeed()) == "ok"
+        assert call_count == 1
+
+    @patch("usf_fabric_cli.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    def test_success_after_retries(self, mock_sleep):
+        """Coroutine should succeed after transient failures, awaiting sleeps."""
+        call_count = 0
+
+        @aretry_with_backoff(max_retries=3, base_delay=0.01)
+        async def flaky():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise RuntimeError("429 rate limited")
+            return "ok"
+
+        assert asyncio.run(flaky()) == "ok"
+        assert call_count == 3
+        assert mock_sleep.await_count == 2
+
+    @patch("usf_fabric_cli.utils.retry.time.sleep")
+    @patch("usf_fabric_cli.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    def test_exhausts_retries_without_blocking_sleep(self, mock_sleep, mock_time):
+        """Should raise after exhausting retries and never call time.sleep."""
+        call_count = 0
+
+        @aretry_with_backoff(max_retries=2, base_delay=0.01)
+        async def always_fail():
+            nonlocal call_count
+            call_count += 1
+            raise RuntimeError("503 Service Unavailable")
+
+        with pytest.raises(RuntimeError, match="503"):
+            asyncio.run(always_fail())
+        assert call_count == 3  # 1 initial + 2 retries
+        mock_time.assert_not_called()
+
+    def test_non_retryable_not_retried(self):
+        """Non-retryable errors should raise immediately."""
+        call_count = 0
+
+        @aretry_with_backoff(max_retries=3, base_delay=0.01)
+        async def permission_denied():
+            nonlocal call_count
+            call_count += 1
+            raise RuntimeError("Permission denied")
+
+        with pytest.raises(RuntimeError, match="Permission denied"):
+            asyncio.run(permission_denied())
+        assert call_count == 1
+
+    @patch("usf_fabric_cli.utils.retry.asyncio.sleep", new_callable=AsyncMock)
+    def test_on_retry_callback(self, mock_sleep):
+        """on_retry callback should be called before each retry."""
+        retry_log = []
+        call_count = 0
+
+        @aretry_with_backoff(
+            max_retries=2,
+            base_delay=0.01,
+            on_retry=lambda exc, attempt, delay: retry_log.append(attempt),
+        )
+        async def flaky():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise RuntimeError("429 rate limited")
+            return "ok"
+
+        asyncio.run(flaky())
+        assert retry_log == [0, 1]
+
+
 class TestRetryRequest:
     """Tests for the retry_request convenience function."""
 
     @patch("usf_fabric_cli.utils.retry.requests.request")
     def test_success_first_try(self, mock_request):
         """Successful request should return response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
+        mock_response = FakeResponse(200)
         mock_request.return_value = mock_response
 
         response = retry_request("GET", "https://api.example.com/data")
@@ -305,13 +486,10 @@ class TestRetryRequest:
     @patch("usf_fabric_cli.utils.retry.requests.request")
     def test_retries_on_transient_error(self, mock_request, mock_sleep):
         """Should retry on transient HTTP errors."""
-        error_response = MagicMock()
-        error_response.status_code = 503
+        error_response = FakeResponse(503)
         error_exc = requests.exceptions.HTTPError(response=error_response)
 
-        success_response = MagicMock()
-        success_response.status_code = 200
-        success_response.raise_for_status = MagicMock()
+        success_response = FakeResponse(200)
 
         call_count = 0
 
@@ -331,8 +509,7 @@ class TestRetryRequest:
     @patch("usf_fabric_cli.utils.retry.requests.request")
     def test_non_retryable_raises_immediately(self, mock_request):
         """Should raise immediately on non-retryable errors (e.g. 403)."""
-        error_response = MagicMock()
-        error_response.status_code = 403
+        error_response = FakeResponse(403)
         error_exc = requests.exceptions.HTTPError(response=error_response)
 
         mock_request.side_effect = error_exc
@@ -3,113 +3,171 @@ Unit tests for secrets management module
 """
 
 import os
+from functools import lru_cache
+from typing import Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from usf_fabric_cli.utils.secrets import (
     FabricSecrets,
+    _resolve_env_file,
     get_environment_variables,
     get_secrets,
 )
 
+_SECRET_VARS = (
+    "AZURE_CLIENT_ID",
+    "AZURE_CLIENT_SECRET",
+    "TENANT_ID",
+    "AZURE_TENANT_ID",
+    "FABRIC_TOKEN",
+    "GITHUB_TOKEN",
+    "AZURE_DEVOPS_PAT",
+    "AZURE_KEYVAULT_URL",
+)
 
-class TestFabricSecrets:
-    """Test secrets loading and validation"""
 
-    def test_load_from_environment_variables(self, monkeypatch):
-        """Test loading secrets from environment variables"""
-        monkeypatch.setenv("AZURE_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("AZURE_CLIENT_SECRET", "test-secret")
-        monkeypatch.setenv("TENANT_ID", "test-tenant")
+@lru_cache(maxsize=32)
+def _cached_secrets(env_file: Optional[str], env_key: frozenset) -> FabricSecrets:
+    """Pristine FabricSecrets per (env file, secret env snapshot); never mutated."""
+    return FabricSecrets(_env_file=env_file)
 
-        secrets = FabricSecrets()
 
-        assert secrets.azure_client_id == "test-client-id"
-        assert secrets.azure_client_secret == "test-secret"
-        assert secrets.tenant_id == "test-tenant"
+def _build_secrets(env_file: Optional[str] = None) -> FabricSecrets:
+    """Return a private copy of the cached FabricSecrets for the current env.
 
-    def test_tenant_id_normalization(self, monkeypatch):
-        """Test tenant ID normalization from AZURE_TENANT_ID"""
-        monkeypatch.setenv("AZURE_TENANT_ID", "test-tenant-id")
-        # Ensure TENANT_ID doesn't interfere from .env or env vars
-        monkeypatch.delenv("TENANT_ID", raising=False)
+    pydantic-settings parsing and validation only run once per unique
+    environment; the copy keeps per-test state (e.g. the cached Key Vault
+    client) from leaking into the shared instance.
+    """
+    env_key = frozenset((k, os.environ[k]) for k in _SECRET_VARS if k in os.environ)
+    return _cached_secrets(env_file, env_key).model_copy()
 
-        # Pass _env_file=None to ignore .env file
-        secrets = FabricSecrets(_env_file=None)
 
-        # Should normalize to tenant_id
-        assert secrets.get_tenant_id() == "test-tenant-id"
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch):
+    """Start every test without credential variables from the host environment.
 
-    def test_validate_fabric_auth_with_service_principal(self, monkeypatch):
-        """Test validation with Service Principal credentials"""
-        monkeypatch.setenv("AZURE_CLIENT_ID", "test-client")
-        monkeypatch.setenv("AZURE_CLIENT_SECRET", "test-secret")
-        monkeypatch.setenv("TENANT_ID", "test-tenant")
+    Also undoes values that get_secrets() backfills into os.environ.
+    """
+    for var in _SECRET_VARS:
+        monkeypatch.delenv(var, raising=False)
 
-        secrets = FabricSecrets()
-        is_valid, error_msg = secrets.validate_fabric_auth()
 
-        assert is_valid is True
-        assert error_msg == ""
+@pytest.fixture
+def make_secrets(monkeypatch):
+    """Factory: build FabricSecrets from the given env overrides, ignoring .env."""
 
-    def test_validate_fabric_auth_with_token(self, monkeypatch):
-        """Test validation with direct token"""
-        monkeypatch.setenv("FABRIC_TOKEN", "test-token")
+    def _factory(**env):
+        for k, v in env.items():
+            monkeypatch.setenv(k, v)
+        return _build_secrets("non_existent_env_file")
 
-        secrets = FabricSecrets()
-        is_valid, error_msg = secrets.validate_fabric_auth()
+    return _factory
 
-        assert is_valid is True
-        assert error_msg == ""
-
-    def test_validate_fabric_auth_missing_credentials(self, monkeypatch):
-        """Test validation with missing credentials"""
-        # Clear potential environment variables
-        for var in [
-            "AZURE_CLIENT_ID",
-            "AZURE_CLIENT_SECRET",
-            "TENANT_ID",
-            "FABRIC_TOKEN",
-        ]:
-            monkeypatch.delenv(var, raising=False)
-
-        # Use non-existent env file to avoid reading local .env
-        secrets = FabricSecrets(_env_file="non_existent_env_file")
-        is_valid, error_msg = secrets.validate_fabric_auth()
 
-        assert is_valid is False
-        assert "Missing Fabric authentication credentials" in error_msg
+@pytest.fixture(scope="session")
+def client_id_env_file(tmp_path_factory):
+    """A .env file setting only AZURE_CLIENT_ID, written once per session."""
+    env_file = tmp_path_factory.mktemp("env") / ".env"
+    env_file.write_text("AZURE_CLIENT_ID=file-client-id\n")
+    return env_file
 
-    def test_validate_git_auth_github(self, monkeypatch):
-        """Test GitHub authentication validation"""
-        monkeypatch.setenv("GITHUB_TOKEN", "test-github-token")
 
-        secrets = FabricSecrets()
-        is_valid, error_msg = secrets.validate_git_auth("github")
+@pytest.fixture
+def snapshot_secrets(monkeypatch, env_snapshots):
+    """Factory: build FabricSecrets with ``os.environ`` replaced by a snapshot."""
 
-        assert is_valid is True
-        assert error_msg == ""
+    def _factory(name):
+        monkeypatch.setattr(os, "environ", env_snapshots[name].copy())
+        return _build_secrets("non_existent_env_file")
 
-    def test_validate_git_auth_azure_devops(self, monkeypatch):
-        """Test Azure DevOps authentication validation"""
-        monkeypatch.setenv("AZURE_DEVOPS_PAT", "test-ado-pat")
+    return _factory
 
-        secrets = FabricSecrets()
-        is_valid, error_msg = secrets.validate_git_auth("azure_devops")
 
-        assert is_valid is True
-        assert error_msg == ""
+class TestFabricSecrets:
+    """Test secrets loading and validation"""
 
-    def test_validate_git_auth_missing(self):
-        """Test Git authentication validation with missing credentials"""
-        # Ensure no token is present regardless of environment
-        with patch.dict(os.environ, {}, clear=True):
-            secrets = FabricSecrets(_env_file=None)
-            is_valid, error_msg = secrets.validate_git_auth("github")
+    def test_load_from_environment_variables(self, snapshot_secrets):
+        """Test loading secrets from environment variables"""
+        secrets = snapshot_secrets("sp")
 
-            assert is_valid is False
-            assert "Missing GitHub authentication" in error_msg
+        assert secrets.azure_client_id == "test-client-id"
+        assert secrets.azure_client_secret == "test-secret"
+        assert secrets.tenant_id == "test-tenant"
+
+    def test_tenant_id_normalization(self, make_secrets):
+        """Test tenant ID normalization from AZURE_TENANT_ID"""
+        secrets = make_secrets(AZURE_TENANT_ID="test-tenant-id")
+
+        # Should normalize to tenant_id
+        assert secrets.get_tenant_id() == "test-tenant-id"
+
+    @pytest.mark.parametrize(
+        "snapshot,expected_valid,msg",
+        [
+            pytest.param("sp", True, "", id="service-principal"),
+            pytest.param("token", True, "", id="token"),
+            pytest.param(
+                "empty",
+                False,
+                "Missing Fabric authentication credentials",
+                id="missing",
+            ),
+        ],
+    )
+    def test_validate_fabric_auth(
+        self, snapshot_secrets, snapshot, expected_valid, msg
+    ):
+        """Fabric auth accepts SP credentials or a token, else reports missing"""
+        is_valid, error_msg = snapshot_secrets(snapshot).validate_fabric_auth()
+
+        assert is_valid is expected_valid
+        if msg:
+            assert msg in error_msg
+        else:
+            assert error_msg == ""
+
+    def test_validate_fabric_auth_lists_missing_sp_fields(self, make_secrets):
+        """Only the Service Principal fields that are unset are reported."""
+        secrets = make_secrets(AZURE_CLIENT_ID="test-client")
+        is_valid, error_msg = secrets.validate_fabric_auth()
+
+        assert is_valid is False
+        assert error_msg.endswith("AZURE_CLIENT_SECRET, TENANT_ID")
+
+    @pytest.mark.parametrize(
+        "snapshot,provider,expected_valid,msg",
+        [
+            pytest.param("github", "github", True, "", id="github"),
+            pytest.param("ado", "azure_devops", True, "", id="azure-devops"),
+            pytest.param("ado", "azuredevops", True, "", id="alias-azuredevops"),
+            pytest.param("ado", "ADO", True, "", id="alias-ado-upper"),
+            pytest.param("ado", "Azure_DevOps", True, "", id="alias-mixed-case"),
+            pytest.param(
+                "empty", "github", False, "Missing GitHub authentication", id="missing"
+            ),
+            pytest.param(
+                "github",
+                "bitbucket",
+                False,
+                "Unknown Git provider: bitbucket",
+                id="unknown-provider",
+            ),
+        ],
+    )
+    def test_validate_git_auth(
+        self, snapshot_secrets, snapshot, provider, expected_valid, msg
+    ):
+        """Git auth checks the provider's credential, matching aliases"""
+        is_valid, error_msg = snapshot_secrets(snapshot).validate_git_auth(provider)
+
+        assert is_valid is expected_valid
+        if msg:
+            assert msg in error_msg
+        else:
+            assert error_msg == ""
 
     @patch.dict(os.environ, {"CI": "true"})
     def test_load_with_fallback_ci_environment(self):
@@ -119,17 +177,8 @@ class TestFabricSecrets:
         # Should detect CI environment
         assert os.getenv("CI") == "true"
 
-    def test_get_secrets_raises_on_invalid(self, monkeypatch):
+    def test_get_secrets_raises_on_invalid(self):
         """Test get_secrets raises ValueError on missing credentials"""
-        # Clear potential environment variables
-        for var in [
-            "AZURE_CLIENT_ID",
-            "AZURE_CLIENT_SECRET",
-            "TENANT_ID",
-            "FABRIC_TOKEN",
-        ]:
-            monkeypatch.delenv(var, raising=False)
-
         # Patch FabricSecrets to ignore .env file
         with patch("usf_fabric_cli.utils.secrets.FabricSecrets") as MockSecrets:
             # We want to use the real logic but with empty config
@@ -165,18 +214,6 @@ class TestFabricSecrets:
     def test_get_secrets_honors_usf_env_file(self, tmp_path, monkeypatch):
         """get_secrets() reads USF_ENV_FILE instead of the default .env when set."""
         monkeypatch.chdir(tmp_path)
-        # get_secrets() backfills resolved values into the real process os.environ
-        # (so subprocesses like `fab` see them), so a prior test's AZURE_TENANT_ID/
-        # AZURE_CLIENT_ID can otherwise leak in here — clear both alias forms.
-        for var in [
-            "AZURE_CLIENT_ID",
-            "AZURE_CLIENT_SECRET",
-            "TENANT_ID",
-            "AZURE_TENANT_ID",
-            "FABRIC_TOKEN",
-        ]:
-            monkeypatch.delenv(var, raising=False)
-
         # A plain .env in cwd that should be IGNORED in favour of USF_ENV_FILE.
         (tmp_path / ".env").write_text("AZURE_CLIENT_ID=default-client-id\n")
 
@@ -204,38 +241,45 @@ class TestFabricSecrets:
 class TestPriorityLoading:
     """Test waterfall priority loading pattern"""
 
-    def test_environment_variable_takes_priority(self, tmp_path, monkeypatch):
+    def test_environment_variable_takes_priority(self, client_id_env_file, monkeypatch):
         """Test that environment variables take priority over .env file"""
-        # Create .env file
-        env_file = tmp_path / ".env"
-        env_file.write_text("AZURE_CLIENT_ID=file-client-id\n")
-
         # Set environment variable (should take priority)
         monkeypatch.setenv("AZURE_CLIENT_ID", "env-client-id")
 
-        secrets = FabricSecrets(_env_file=str(env_file))
+        secrets = _build_secrets(str(client_id_env_file))
 
         # Environment variable should win
         assert secrets.azure_client_id == "env-client-id"
 
-    def test_fallback_to_env_file(self, tmp_path, monkeypatch):
+    def test_fallback_to_env_file(self, client_id_env_file):
         """Test fallback to .env file when env var not set"""
-        # Clear env var to ensure fallback
-        monkeypatch.delenv("AZURE_CLIENT_ID", raising=False)
-
-        # Create .env file
-        env_file = tmp_path / ".env"
-        env_file.write_text("AZURE_CLIENT_ID=file-client-id\n")
-
-        secrets = FabricSecrets(_env_file=str(env_file))
+        secrets = _build_secrets(str(client_id_env_file))
 
         # Should load from file
         assert secrets.azure_client_id == "file-client-id"
 
+    def test_env_file_skipped_when_environment_is_complete(self, monkeypatch):
+        """No .env parse is needed once every setting comes from the environment."""
+        for var in _SECRET_VARS:
+            monkeypatch.setenv(var, "from-env")
+
+        assert _resolve_env_file(".env") is None
+
+    def test_env_file_kept_when_a_setting_is_missing(self, tmp_path, monkeypatch):
+        """A single unset field keeps the .env file in play."""
+        for var in _SECRET_VARS:
+            if var != "GITHUB_TOKEN":
+                monkeypatch.setenv(var, "from-env")
+        env_file = tmp_path / ".env"
+        env_file.write_text("GITHUB_TOKEN=file-token\n")
+
+        assert _resolve_env_file(str(env_file)) == str(env_file)
+        secrets = FabricSecrets.load_with_fallback(env_file=str(env_file))
+        assert secrets.github_token == "file-token"
+
     def test_load_with_fallback_honors_usf_env_file(self, tmp_path, monkeypatch):
         """load_with_fallback() with no args still honors USF_ENV_FILE."""
         monkeypatch.chdir(tmp_path)
-        monkeypatch.delenv("AZURE_CLIENT_ID", raising=False)
 
         (tmp_path / ".env").write_text("AZURE_CLIENT_ID=default-client-id\n")
         (tmp_path / ".env.client").write_text("AZURE_CLIENT_ID=client-specific-id\n")
@@ -250,7 +294,6 @@ class TestPriorityLoading:
     ):
         """An explicit env_file argument still wins over USF_ENV_FILE."""
         monkeypatch.chdir(tmp_path)
-        monkeypatch.delenv("AZURE_CLIENT_ID", raising=False)
 
         (tmp_path / ".env.client").write_text("AZURE_CLIENT_ID=client-specific-id\n")
         (tmp_path / ".env.explicit").write_text("AZURE_CLIENT_ID=explicit-id\n")
@@ -264,35 +307,16 @@ class TestPriorityLoading:
 class TestKeyVaultIntegration:
     """Test Azure Key Vault fallback paths (mocked, no real credentials)."""
 
-    def _make_secrets(self, monkeypatch, **overrides):
-        """Helper: create FabricSecrets with clean env + optional overrides."""
-        for var in [
-            "AZURE_CLIENT_ID",
-            "AZURE_CLIENT_SECRET",
-            "TENANT_ID",
-            "AZURE_TENANT_ID",
-            "FABRIC_TOKEN",
-            "GITHUB_TOKEN",
-            "AZURE_DEVOPS_PAT",
-            "AZURE_KEYVAULT_URL",
-        ]:
-            monkeypatch.delenv(var, raising=False)
-        for k, v in overrides.items():
-            monkeypatch.setenv(k, v)
-        return FabricSecrets(_env_file="non_existent_env_file")
-
     # ── _get_from_keyvault ─────────────────────────────────────────
 
     @patch("usf_fabric_cli.utils.secrets.KEYVAULT_AVAILABLE", True)
     @patch("usf_fabric_cli.utils.secrets.SecretClient")
     @patch("usf_fabric_cli.utils.secrets.DefaultAzureCredential")
     def test_get_from_keyvault_success(
-        self, mock_cred_cls, mock_client_cls, monkeypatch
+        self, mock_cred_cls, mock_client_cls, make_secrets
     ):
         """_get_from_keyvault returns secret value when KV is reachable."""
-        secrets = self._make_secrets(
-            monkeypatch, AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net"
-        )
+        secrets = make_secrets(AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net")
 
         mock_secret = MagicMock()
         mock_secret.value = "kv-secret-value"
@@ -308,12 +332,10 @@ class TestKeyVaultIntegration:
     @patch("usf_fabric_cli.utils.secrets.SecretClient")
     @patch("usf_fabric_cli.utils.secrets.DefaultAzureCredential")
     def test_get_from_keyvault_failure_returns_none(
-        self, mock_cred_cls, mock_client_cls, monkeypatch
+        self, mock_cred_cls, mock_client_cls, make_secrets
     ):
         """_get_from_keyvault returns None when KV call raises."""
-        secrets = self._make_secrets(
-            monkeypatch, AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net"
-        )
+        secrets = make_secrets(AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net")
         mock_client_cls.return_value.get_secret.side_effect = ValueError(
             "403 Forbidden"
         )
@@ -322,17 +344,15 @@ class TestKeyVaultIntegration:
         assert result is None
 
     @patch("usf_fabric_cli.utils.secrets.KEYVAULT_AVAILABLE", False)
-    def test_get_from_keyvault_skipped_when_sdk_missing(self, monkeypatch):
+    def test_get_from_keyvault_skipped_when_sdk_missing(self, make_secrets):
         """_get_from_keyvault returns None when azure-keyvault-secrets not installed."""
-        secrets = self._make_secrets(
-            monkeypatch, AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net"
-        )
+        secrets = make_secrets(AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net")
         # Should be a noop — no SDK to call
         assert secrets._get_from_keyvault("azure-client-id") is None
 
-    def test_get_from_keyvault_skipped_when_no_url(self, monkeypatch):
+    def test_get_from_keyvault_skipped_when_no_url(self, make_secrets):
         """_get_from_keyvault returns None when AZURE_KEYVAULT_URL is not set."""
-        secrets = self._make_secrets(monkeypatch)
+        secrets = make_secrets()
         assert secrets.azure_keyvault_url is None
         assert secrets._get_from_keyvault("anything") is None
 
@@ -342,12 +362,10 @@ class TestKeyVaultIntegration:
     @patch("usf_fabric_cli.utils.secrets.SecretClient")
     @patch("usf_fabric_cli.utils.secrets.DefaultAzureCredential")
     def test_get_secret_falls_back_to_keyvault(
-        self, mock_cred_cls, mock_client_cls, monkeypatch
+        self, mock_cred_cls, mock_client_cls, make_secrets
     ):
         """get_secret tries Key Vault when env var is missing."""
-        secrets = self._make_secrets(
-            monkeypatch, AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net"
-        )
+        secrets = make_secrets(AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net")
 
         mock_secret = MagicMock()
         mock_secret.value = "from-kv"
@@ -362,12 +380,10 @@ class TestKeyVaultIntegration:
     @patch("usf_fabric_cli.utils.secrets.SecretClient")
     @patch("usf_fabric_cli.utils.secrets.DefaultAzureCredential")
     def test_get_secret_env_var_beats_keyvault(
-        self, mock_cred_cls, mock_client_cls, monkeypatch
+        self, mock_cred_cls, mock_client_cls, make_secrets
     ):
         """get_secret prefers env var over Key Vault."""
-        monkeypatch.setenv("MY_VAR", "from-env")
-        secrets = self._make_secrets(
-            monkeypatch,
+        secrets = make_secrets(
             AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net",
             MY_VAR="from-env",
         )
@@ -383,7 +399,7 @@ class TestKeyVaultIntegration:
     @patch("usf_fabric_cli.utils.secrets.SecretClient")
     @patch("usf_fabric_cli.utils.secrets.DefaultAzureCredential")
     def test_load_with_fallback_populates_from_keyvault(
-        self, mock_cred_cls, mock_client_cls, monkeypatch
+        self, mock_cred_cls, mock_client_cls, make_secrets
     ):
         """load_with_fallback fills missing fields from Key Vault."""
         # Map KV secret names → values
@@ -419,6 +435,22 @@ class TestKeyVaultIntegration:
         assert instance.github_token == "kv-gh"
         assert instance.azure_devops_pat == "kv-pat"
 
+    @patch("usf_fabric_cli.utils.secrets.KEYVAULT_AVAILABLE", True)
+    @patch("usf_fabric_cli.utils.secrets.SecretClient")
+    @patch("usf_fabric_cli.utils.secrets.DefaultAzureCredential")
+    def test_keyvault_client_is_reused(
+        self, mock_cred_cls, mock_client_cls, make_secrets
+    ):
+        """Repeated Key Vault lookups share one credential and SecretClient."""
+        secrets = make_secrets(AZURE_KEYVAULT_URL="https://my-vault.vault.azure.net")
+
+        for name in ("azure-client-id", "azure-client-secret", "tenant-id"):
+            secrets._get_from_keyvault(name)
+
+        assert mock_client_cls.call_count == 1
+        assert mock_cred_cls.call_count == 1
+        assert mock_client_cls.return_value.get_secret.call_count == 3
+
     @patch("usf_fabric_cli.utils.secrets.KEYVAULT_AVAILABLE", False)
     def test_load_with_fallback_skips_kv_when_sdk_missing(self, monkeypatch):
         """load_with_fallback doesn't error when azure SDK unavailable."""
@@ -8,12 +8,14 @@ Tests verify:
 - Log rotation at size threshold
 """
 
+import gc
 import json
 import os
 from unittest.mock import patch
 
 import pytest
 
+from usf_fabric_cli.utils import telemetry
 from usf_fabric_cli.utils.telemetry import TelemetryClient
 
 
@@ -29,6 +31,7 @@ class TestTelemetryEmit:
             duration_ms=1500,
             metadata={"workspace": "test-ws"},
         )
+        client.close()
 
         log_file = tmp_path / "fabric_cli_telemetry.jsonl"
         assert log_file.exists()
@@ -49,6 +52,7 @@ class TestTelemetryEmit:
         client = TelemetryClient(log_directory=str(tmp_path))
         for i in range(3):
             client.emit(command=f"cmd-{i}", status="success")
+        client.close()
 
         log_file = tmp_path / "fabric_cli_telemetry.jsonl"
         with open(log_file, "r") as f:
@@ -60,6 +64,90 @@ class TestTelemetryEmit:
             assert data["command"] == f"cmd-{i}"
 
 
+class TestTelemetrySerialization:
+    """Tests for event serialization (orjson when installed, else json)."""
+
+    @pytest.mark.parametrize("use_orjson", [False, True], ids=["json", "orjson"])
+    def test_serializer_output_matches_json(self, use_orjson):
+        """Both backends produce the same decoded event, int keys included."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        record = {"command": "deploy", "metadata": {"ws": "x", 1: "one"}}
+
+        with patch.object(telemetry, "ORJSON_AVAILABLE", use_orjson):
+            line = telemetry._dumps(record)
+
+        assert "\n" not in line
+        assert json.loads(line) == json.loads(json.dumps(record))
+
+
+class TestTelemetryFileHandle:
+    """Tests for the long-lived log file handle."""
+
+    def test_handle_reused_across_events(self, tmp_path):
+        """Consecutive events share one open handle."""
+        with TelemetryClient(log_directory=str(tmp_path)) as client:
+            client.emit(command="a", status="success")
+            first = client._fh
+            client.emit(command="b", status="success")
+
+            assert client._fh is first
+
+    def test_close_releases_handle(self, tmp_path):
+        """close() closes the handle; a later emit reopens the file."""
+        client = TelemetryClient(log_directory=str(tmp_path))
+        client.emit(command="a", status="success")
+        fh = client._fh
+
+        client.close()
+        assert fh.closed
+        assert client._fh is None
+
+        client.emit(command="b", status="success")
+        client.close()
+        lines = (tmp_path / "fabric_cli_telemetry.jsonl").read_text().splitlines()
+        assert [json.loads(line)["command"] for line in lines] == ["a", "b"]
+
+    def test_unclosed_handle_released_on_collection(self, tmp_path):
+        """A client dropped without close() does not leak its handle."""
+        client = TelemetryClient(log_directory=str(tmp_path))
+        client.emit(command="a", status="success")
+        fh = client._fh
+
+        del client
+        gc.collect()
+        assert fh.closed
+
+    def test_follows_rotation_by_another_client(self, tmp_path):
+        """A client reopens the log after another client rotates it."""
+        first = TelemetryClient(log_directory=str(tmp_path))
+        second = TelemetryClient(log_directory=str(tmp_path))
+        first.emit(command="a1", status="success")
+        second.emit(command="b1", status="success")
+
+        with patch.object(
+            TelemetryClient,
+            "_max_log_size",
+            new_callable=lambda: property(lambda self: 10),
+        ):
+            second.emit(command="b2", status="success")
+        for command in ("a2", "b3", "a3"):
+            client = first if command.startswith("a") else second
+            client.emit(command=command, status="success")
+        first.close()
+        second.close()
+
+        def commands(path):
+            return [
+                json.loads(line)["command"] for line in path.read_text().splitlines()
+            ]
+
+        rotated = tmp_path / "fabric_cli_telemetry.jsonl.1"
+        current = tmp_path / "fabric_cli_telemetry.jsonl"
+        assert commands(rotated) == ["a1", "b1"]
+        assert commands(current) == ["b2", "a2", "b3", "a3"]
+
+
 class TestTelemetryDisabled:
     """Tests for disabled telemetry client."""
 
@@ -103,15 +191,91 @@ class TestTelemetryRotation:
             new_callable=lambda: property(lambda self: 50),
         ):
             client.emit(command="deploy", status="success")
+        client.close()
 
         # Original file should still exist (with new content)
         assert log_file.exists()
+        assert (tmp_path / "fabric_cli_telemetry.jsonl.1").read_text() == (
+            "x" * 100 + "\n"
+        )
+
+    def test_size_tracked_without_restat(self, tmp_path):
+        """Events after the first do not re-read the size from the handle."""
+        client = TelemetryClient(log_directory=str(tmp_path))
+        client.emit(command="a", status="success")
+
+        with patch("usf_fabric_cli.utils.telemetry.os.fstat") as mock_fstat:
+            client.emit(command="b", status="success")
+        client.close()
+
+        mock_fstat.assert_not_called()
+        log_file = tmp_path / "fabric_cli_telemetry.jsonl"
+        assert client._size == log_file.stat().st_size
+
+    def test_rotation_triggers_from_tracked_size(self, tmp_path):
+        """Growth from this client's own writes triggers rotation."""
+        client = TelemetryClient(log_directory=str(tmp_path))
+
+        with patch.object(
+            type(client),
+            "_max_log_size",
+            new_callable=lambda: property(lambda self: 10),
+        ):
+            client.emit(command="first", status="success")
+            client.emit(command="second", status="success")
+        client.close()
+
+        rotated = tmp_path / "fabric_cli_telemetry.jsonl.1"
+        current = tmp_path / "fabric_cli_telemetry.jsonl"
+        assert json.loads(rotated.read_text())["command"] == "first"
+        assert json.loads(current.read_text())["command"] == "second"
+
+    def test_rotation_rechecks_file_already_rotated(self, tmp_path):
+        """A log rotated by another writer is not rotated a second time."""
+        client = TelemetryClient(log_directory=str(tmp_path))
+        client.emit(command="first", status="success")
+
+        log_file = tmp_path / "fabric_cli_telemetry.jsonl"
+        rotated = tmp_path / "fabric_cli_telemetry.jsonl.1"
+        log_file.rename(rotated)
+        log_file.write_text('{"command": "other"}\n')
+
+        with patch.object(
+            type(client),
+            "_max_log_size",
+            new_callable=lambda: property(lambda self: 10),
+        ):
+            client._rotate_if_needed()
+
+        assert client._fh is None
+        assert json.loads(rotated.read_text())["command"] == "first"
+        assert json.loads(log_file.read_text())["command"] == "other"
+
+    def test_rotation_uses_size_on_disk(self, tmp_path):
+        """The tracked size is refreshed from the file before rotating."""
+        client = TelemetryClient(log_directory=str(tmp_path))
+        client.emit(command="first", status="success")
+        # Another writer truncated the log below the threshold
+        log_file = tmp_path / "fabric_cli_telemetry.jsonl"
+        os.truncate(log_file, 0)
+
+        with patch.object(
+            type(client),
+            "_max_log_size",
+            new_callable=lambda: property(lambda self: 10),
+        ):
+            client._rotate_if_needed()
+        client.close()
+
+        assert client._size == 0
+        assert not (tmp_path / "fabric_cli_telemetry.jsonl.1").exists()
 
     def test_no_rotation_below_threshold(self, tmp_path):
         """Log should NOT rotate when below size threshold."""
         client = TelemetryClient(log_directory=str(tmp_path))
 
         client.emit(command="deploy", status="success")
+        client.close()
 
         rotated = tmp_path / "fabric_cli_telemetry.jsonl.1"
         assert not rotated.exists()
@@ -125,6 +289,7 @@ class TestTelemetryEdgeCases:
         log_dir = tmp_path / "subdir" / "telemetry"
         client = TelemetryClient(log_directory=str(log_dir))
         client.emit(command="test", status="success")
+        client.close()
 
         log_file = log_dir / "fabric_cli_telemetry.jsonl"
         assert log_file.exists()
@@ -12,53 +12,123 @@ from usf_fabric_cli.utils.templating import (
 )
 
 
+@pytest.fixture(scope="module")
+def engine():
+    """One ArtifactTemplateEngine (and Jinja2 environment) shared per module."""
+    return ArtifactTemplateEngine()
+
+
+@pytest.fixture(scope="module")
+def strict_engine():
+    """Shared engine with strict undefined-variable handling enabled."""
+    return ArtifactTemplateEngine(strict_mode=True)
+
+
+@pytest.fixture(scope="module")
+def template_files(tmp_path_factory):
+    """Read-only template inputs written once for the module."""
+    root = tmp_path_factory.mktemp("templates")
+    notebook = {
+        "cells": [
+            {
+                "cell_type": "code",
+                "source": "connection_string = '{{ connection_string }}'",
+            }
+        ],
+        "metadata": {"lakehouse": "{{ lakehouse_name }}"},
+    }
+    contents = {
+        "notebook": ("notebook_template.json", json.dumps(notebook)),
+        "valid": ("valid_template.txt", "Hello {{ name }}, env: {{ environment }}"),
+        "incomplete": ("incomplete_template.txt", "Hello {{ name }}"),
+        # Missing closing braces
+        "bad": ("bad_template.txt", "Hello {{ name"),
+    }
+    files = {}
+    for key, (name, text) in contents.items():
+        files[key] = root / name
+        files[key].write_text(text)
+    return files
+
+
+@pytest.fixture(scope="module")
+def templater():
+    """Shared FabricArtifactTemplater; it keeps no per-render state."""
+    return FabricArtifactTemplater()
+
+
 class TestArtifactTemplateEngine:
     """Test template engine core functionality"""
 
-    def test_render_simple_string(self):
+    def test_render_simple_string(self, engine):
         """Test rendering simple template string"""
-        engine = ArtifactTemplateEngine()
-
         template = "Hello {{ name }}!"
         variables = {"name": "World"}
 
         result = engine.render_string(template, variables)
         assert result == "Hello World!"
 
-    def test_render_with_multiple_variables(self):
+    def test_render_with_multiple_variables(self, engine):
         """Test rendering with multiple variables"""
-        engine = ArtifactTemplateEngine()
-
         template = "Environment: {{ environment }}, Capacity: {{ capacity_id }}"
         variables = {"environment": "prod", "capacity_id": "F64"}
 
         result = engine.render_string(template, variables)
         assert result == "Environment: prod, Capacity: F64"
 
-    def test_render_with_filters(self):
+    def test_render_with_filters(self, engine):
         """Test rendering with Jinja2 filters"""
-        engine = ArtifactTemplateEngine()
-
         template = "Upper: {{ name | upper }}, Lower: {{ name | lower }}"
         variables = {"name": "Test"}
 
         result = engine.render_string(template, variables)
         assert result == "Upper: TEST, Lower: test"
 
-    def test_strict_mode_raises_on_undefined(self):
+    def test_strict_mode_raises_on_undefined(self, strict_engine):
         """Test that strict mode raises error on undefined variables"""
-        engine = ArtifactTemplateEngine(strict_mode=True)
-
         template = "Hello {{ undefined_var }}!"
         variables = {}
 
         with pytest.raises(ValueError, match="Undefined variable"):
-            engine.render_string(template, variables)
+            strict_engine.render_string(template, variables)
 
-    def test_validate_only_mode(self):
-        """Test validation without rendering"""
+    def test_repeated_render_is_memoized(self):
+        """Same template and scalar variables render once, then hit the cache."""
         engine = ArtifactTemplateEngine()
 
+        first = engine.render_string("Hello {{ name }}!", {"name": "World"})
+        second = engine.render_string("Hello {{ name }}!", {"name": "World"})
+
+        assert first == second == "Hello World!"
+        assert engine._render_memo.cache_info().hits == 1
+
+    def test_template_compiled_once_for_different_variables(self):
+        """Rendering one template with new values reuses the compiled template."""
+        engine = ArtifactTemplateEngine()
+
+        assert engine.render_string("{{ env }}", {"env": "dev"}) == "dev"
+        assert engine.render_string("{{ env }}", {"env": "prod"}) == "prod"
+
+        info = engine._compile.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_memo_distinguishes_equal_values_of_different_types(self, engine):
+        """1 and True hash alike but must not share a cached rendering."""
+        assert engine.render_string("{{ v }}", {"v": 1}) == "1"
+        assert engine.render_string("{{ v }}", {"v": True}) == "True"
+
+    def test_non_scalar_variables_bypass_memo(self):
+        """Mutable variable values are rendered fresh every time."""
+        engine = ArtifactTemplateEngine()
+        items = ["a"]
+
+        assert engine.render_string("{{ items | length }}", {"items": items}) == "1"
+        items.append("b")
+        assert engine.render_string("{{ items | length }}", {"items": items}) == "2"
+        assert engine._render_memo.cache_info().currsize == 0
+
+    def test_validate_only_mode(self, engine):
+        """Test validation without rendering"""
         # Valid template
         valid_template = "Hello {{ name }}!"
         result = engine.render_string(valid_template, {}, validate_only=True)
@@ -69,10 +139,8 @@ class TestArtifactTemplateEngine:
         result = engine.render_string(invalid_template, {}, validate_only=True)
         assert result is False
 
-    def test_render_json(self):
+    def test_render_json(self, engine):
         """Test rendering JSON templates"""
-        engine = ArtifactTemplateEngine()
-
         json_template = {
             "name": "{{ item_name }}",
             "environment": "{{ env }}",
@@ -87,10 +155,8 @@ class TestArtifactTemplateEngine:
         assert result["environment"] == "dev"
         assert result["config"]["capacity"] == "F2"
 
-    def test_prepare_environment_variables(self):
+    def test_prepare_environment_variables(self, engine):
         """Test environment variable preparation"""
-        engine = ArtifactTemplateEngine()
-
         base_vars = {"project": "MyProject", "capacity": "F2"}
 
         env_vars = {"capacity": "F64", "region": "eastus"}  # Override  # New
@@ -114,10 +180,18 @@ class TestArtifactTemplateEngine:
 
         assert set(variables) == {"name", "environment", "capacity_id"}
 
-    def test_render_file(self, tmp_path):
-        """Test rendering template from file"""
-        engine = ArtifactTemplateEngine()
+    def test_extract_template_variables_returns_fresh_list(self):
+        """Cached extraction still hands each caller its own list."""
+        template = "{{ b }} {{ a }} {{ b }}"
+
+        first = ArtifactTemplateEngine.extract_template_variables(template)
+        first.append("mutated")
+        second = ArtifactTemplateEngine.extract_template_variables(template)
+
+        assert second == ["a", "b"]
 
+    def test_render_file(self, engine, tmp_path):
+        """Test rendering template from file"""
         # Create template file
         template_file = tmp_path / "template.txt"
         template_file.write_text("Hello {{ name }}!")
@@ -133,24 +207,9 @@ class TestArtifactTemplateEngine:
 class TestFabricArtifactTemplater:
     """Test Fabric-specific artifact templating"""
 
-    def test_render_notebook(self, tmp_path):
+    def test_render_notebook(self, templater, template_files, tmp_path):
         """Test rendering a Fabric notebook"""
-        templater = FabricArtifactTemplater()
-
-        # Create mock notebook template
-        notebook_template = {
-            "cells": [
-                {
-                    "cell_type": "code",
-                    "source": "connection_string = '{{ connection_string }}'",
-                }
-            ],
-            "metadata": {"lakehouse": "{{ lakehouse_name }}"},
-        }
-
-        template_file = tmp_path / "notebook_template.json"
-        with open(template_file, "w") as f:
-            json.dump(notebook_template, f)
+        template_file = template_files["notebook"]
 
         # Render
         output_file = tmp_path / "notebook.json"
@@ -168,10 +227,8 @@ class TestFabricArtifactTemplater:
         assert result["metadata"]["lakehouse"] == "ProdLakehouse"
         assert output_file.exists()
 
-    def test_render_lakehouse_definition(self, tmp_path):
+    def test_render_lakehouse_definition(self, templater, tmp_path):
         """Test rendering a Lakehouse definition"""
-        templater = FabricArtifactTemplater()
-
         # Create mock lakehouse definition
         lakehouse_template = {
             "displayName": "{{ lakehouse_name }}",
@@ -179,10 +236,6 @@ class TestFabricArtifactTemplater:
             "properties": {"oneLakeFilesPath": "{{ onelake_path }}"},
         }
 
-        template_file = tmp_path / "lakehouse_template.json"
-        with open(template_file, "w") as f:
-            json.dump(lakehouse_template, f)
-
         # Render
         output_file = tmp_path / "lakehouse.json"
         variables = {
@@ -191,18 +244,17 @@ class TestFabricArtifactTemplater:
             "onelake_path": "/workspaces/prod/sales",
         }
 
+        # Pass the parsed template directly; no template file round trip
         result = templater.render_lakehouse_definition(
-            template_file, variables, output_file
+            lakehouse_template, variables, output_file
         )
 
         assert result["displayName"] == "SalesLakehouse"
         assert result["description"] == "Production lakehouse"
         assert result["properties"]["oneLakeFilesPath"] == "/workspaces/prod/sales"
 
-    def test_render_pipeline(self, tmp_path):
+    def test_render_pipeline(self, templater, tmp_path):
         """Test rendering a Data Pipeline"""
-        templater = FabricArtifactTemplater()
-
         # Create mock pipeline template
         pipeline_template = {
             "name": "{{ pipeline_name }}",
@@ -214,10 +266,6 @@ class TestFabricArtifactTemplater:
             ],
         }
 
-        template_file = tmp_path / "pipeline_template.json"
-        with open(template_file, "w") as f:
-            json.dump(pipeline_template, f)
-
         # Render
         output_file = tmp_path / "pipeline.json"
         variables = {
@@ -226,7 +274,7 @@ class TestFabricArtifactTemplater:
             "source_connection": "server=prod-db;database=source",
         }
 
-        result = templater.render_pipeline(template_file, variables, output_file)
+        result = templater.render_pipeline(pipeline_template, variables, output_file)
 
         assert result["name"] == "ETL_Pipeline"
         assert result["activities"][0]["name"] == "CopyProd"
@@ -235,13 +283,9 @@ class TestFabricArtifactTemplater:
             == "server=prod-db;database=source"
         )
 
-    def test_validate_artifact_template(self, tmp_path):
+    def test_validate_artifact_template(self, templater, template_files):
         """Test artifact template validation"""
-        templater = FabricArtifactTemplater()
-
-        # Create valid template
-        template_file = tmp_path / "valid_template.txt"
-        template_file.write_text("Hello {{ name }}, env: {{ environment }}")
+        template_file = template_files["valid"]
 
         is_valid, errors = templater.validate_artifact_template(
             template_file, required_variables=["name", "environment"]
@@ -250,13 +294,11 @@ class TestFabricArtifactTemplater:
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_validate_artifact_template_missing_variables(self, tmp_path):
+    def test_validate_artifact_template_missing_variables(
+        self, templater, template_files
+    ):
         """Test validation catches missing required variables"""
-        templater = FabricArtifactTemplater()
-
-        # Create template missing required variable
-        template_file = tmp_path / "incomplete_template.txt"
-        template_file.write_text("Hello {{ name }}")
+        template_file = template_files["incomplete"]
 
         is_valid, errors = templater.validate_artifact_template(
             template_file,
@@ -266,13 +308,9 @@ class TestFabricArtifactTemplater:
         assert is_valid is False
         assert any("Missing required variables" in error for error in errors)
 
-    def test_validate_artifact_template_syntax_error(self, tmp_path):
+    def test_validate_artifact_template_syntax_error(self, templater, template_files):
         """Test validation catches syntax errors"""
-        templater = FabricArtifactTemplater()
-
-        # Create template with syntax error
-        template_file = tmp_path / "bad_template.txt"
-        template_file.write_text("Hello {{ name")  # Missing closing braces
+        template_file = template_files["bad"]
 
         is_valid, errors = templater.validate_artifact_template(template_file)
 
@@ -283,10 +321,8 @@ class TestFabricArtifactTemplater:
 class TestComplexScenarios:
     """Test complex real-world scenarios"""
 
-    def test_environment_specific_connection_strings(self):
+    def test_environment_specific_connection_strings(self, engine):
         """Test changing connection strings based on environment"""
-        engine = ArtifactTemplateEngine()
-
         notebook_source = """
 # Connect to database
 connection_string = "{{ db_server }};Database={{ db_name }}"
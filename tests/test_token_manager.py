@@ -33,6 +33,7 @@ class TestTokenInfo:
         assert info.token == "test-token-123"
         assert info.expires_on == expires
         assert info.acquired_at == now
+        assert not hasattr(info, "__dict__")
 
 
 class TestTokenManager:
@@ -130,6 +131,37 @@ class TestTokenManager:
 
         assert mock_credential.get_token.call_count == 2
 
+    @pytest.mark.parametrize(
+        "jitter, seconds_left, refreshes",
+        [
+            pytest.param(0.9, 57, False, id="min-jitter-outside-buffer"),
+            pytest.param(0.9, 50, True, id="min-jitter-inside-buffer"),
+            pytest.param(1.1, 63, True, id="max-jitter-inside-buffer"),
+            pytest.param(1.1, 70, False, id="max-jitter-outside-buffer"),
+        ],
+    )
+    def test_refresh_buffer_jitter_window(
+        self, manager, mock_credential, jitter, seconds_left, refreshes
+    ):
+        """Test the 60s buffer is scaled by the jitter drawn per token."""
+        from usf_fabric_cli.services.token_manager import TokenInfo
+
+        with patch(
+            "usf_fabric_cli.services.token_manager.random.uniform",
+            return_value=jitter,
+        ) as mock_uniform:
+            manager.get_token()
+        mock_uniform.assert_called_once_with(0.9, 1.1)
+
+        manager._token_info = TokenInfo(
+            token="old-token",
+            expires_on=datetime.now(timezone.utc) + timedelta(seconds=seconds_left),
+            acquired_at=datetime.now(timezone.utc) - timedelta(minutes=55),
+        )
+        manager.get_token()
+
+        assert mock_credential.get_token.call_count == (2 if refreshes else 1)
+
     def test_token_age_seconds_returns_correct_age(self, manager, mock_credential):
         """Test token_age_seconds property."""
         manager.get_token()
@@ -212,6 +244,63 @@ class TestRefreshFabricCliAuth:
 
         assert result is False
 
+    @patch("usf_fabric_cli.services.token_manager.subprocess.run")
+    def test_refresh_cli_auth_reuses_recent_login(self, mock_run, manager):
+        """Test a recent successful login is reused unless forced."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        assert manager.refresh_fabric_cli_auth() is True
+        assert manager.refresh_fabric_cli_auth() is True
+        assert mock_run.call_count == 3
+
+        assert manager.refresh_fabric_cli_auth(force=True) is True
+        assert mock_run.call_count == 6
+
+    @patch("usf_fabric_cli.services.token_manager.subprocess.run")
+    def test_refresh_cli_auth_ttl_expiry(self, mock_run, manager):
+        """Test the CLI logs in again once the refresh TTL has passed."""
+        mock_run.return_value = MagicMock(returncode=0)
+        manager._cli_refresh_ttl = timedelta(0)
+
+        manager.refresh_fabric_cli_auth()
+        manager.refresh_fabric_cli_auth()
+
+        assert mock_run.call_count == 6
+
+    @patch("usf_fabric_cli.services.token_manager.subprocess.run")
+    def test_refresh_cli_auth_failure_not_reused(self, mock_run, manager):
+        """Test a failed login is retried on the next call."""
+        from subprocess import TimeoutExpired
+
+        mock_run.side_effect = TimeoutExpired("fab", 30)
+        assert manager.refresh_fabric_cli_auth() is False
+
+        mock_run.side_effect = None
+        mock_run.return_value = MagicMock(returncode=0)
+        assert manager.refresh_fabric_cli_auth() is True
+
+    @patch("usf_fabric_cli.services.token_manager.subprocess.run")
+    def test_ensure_fresh_auth_forces_when_older_than_max_age(self, mock_run, manager):
+        """Test a max age below the refresh TTL still triggers a login."""
+        mock_run.return_value = MagicMock(returncode=0)
+        access_token = MagicMock()
+        access_token.token = "token-1"
+        access_token.expires_on = (
+            datetime.now(timezone.utc) + timedelta(hours=1)
+        ).timestamp()
+        manager._credential.get_token.return_value = access_token
+
+        assert manager.ensure_fresh_auth() is True
+        assert mock_run.call_count == 3
+
+        # Recent login, unchanged token: nothing to do
+        assert manager.ensure_fresh_auth(max_age_seconds=60) is True
+        assert mock_run.call_count == 3
+
+        manager._last_cli_auth -= timedelta(seconds=120)
+        assert manager.ensure_fresh_auth(max_age_seconds=60) is True
+        assert mock_run.call_count == 6
+
     @patch("usf_fabric_cli.services.token_manager.subprocess.run")
     def test_refresh_cli_auth_timeout(self, mock_run, manager):
         """Test CLI re-authentication timeout."""
@@ -6,8 +6,8 @@ Note: This is a simple in-memory implementation.
 For production, replace with a proper database.
 """
 
-from datetime import datetime
-from typing import Dict
+from datetime import datetime, timezone
+from typing import Dict, List
 
 from app.models import ProgressUpdate, UserProgress
 from fastapi import APIRouter, HTTPException, Request
@@ -17,6 +17,10 @@ router = APIRouter()
 # In-memory storage (replace with database for production)
 _progress_store: Dict[str, UserProgress] = {}
 
+# Completed step IDs per scenario, as insertion-ordered sets (dict keys) so
+# membership checks and removals are O(1) while the API keeps list order
+_completed_steps: Dict[str, Dict[str, None]] = {}
+
 
 @router.get("/{scenario_id}", response_model=UserProgress)
 async def get_progress(request: Request, scenario_id: str):
@@ -57,36 +61,36 @@ async def update_progress(
             status_code=404, detail=f"Scenario '{scenario_id}' not found"
         )
 
-    scenario = scenarios[scenario_id]
-
     # Verify step exists
-    step_ids = [step.id for step in scenario.steps]
-    if update.step_id not in step_ids:
+    if (scenario_id, update.step_id) not in request.app.state.step_index:
         raise HTTPException(
             status_code=404,
             detail=f"Step '{update.step_id}' not found in scenario '{scenario_id}'",
         )
 
+    # One timestamp per update, shared by started_at on first write
+    now = datetime.now(timezone.utc).isoformat()
+
     # Get or create progress
     if scenario_id not in _progress_store:
         _progress_store[scenario_id] = UserProgress(
             scenario_id=scenario_id,
             completed_steps=[],
-            started_at=datetime.utcnow().isoformat(),
+            started_at=now,
             last_updated=None,
         )
 
     progress = _progress_store[scenario_id]
 
     # Update progress
+    completed = _completed_steps.setdefault(scenario_id, {})
     if update.completed:
-        if update.step_id not in progress.completed_steps:
-            progress.completed_steps.append(update.step_id)
+        completed[update.step_id] = None
     else:
-        if update.step_id in progress.completed_steps:
-            progress.completed_steps.remove(update.step_id)
+        completed.pop(update.step_id, None)
+    progress.completed_steps = list(completed)
 
-    progress.last_updated = datetime.utcnow().isoformat()
+    progress.last_updated = now
 
     return progress
 
@@ -96,13 +100,13 @@ async def reset_progress(request: Request, scenario_id: str):
     """
     Reset progress for a specific scenario.
     """
-    if scenario_id in _progress_store:
-        del _progress_store[scenario_id]
+    _progress_store.pop(scenario_id, None)
+    _completed_steps.pop(scenario_id, None)
 
     return {"message": f"Progress reset for scenario '{scenario_id}'"}
 
 
-@router.get("/")
+@router.get("/", response_model=List[UserProgress])
 async def get_all_progress():
     """
     Get progress for all scenarios.
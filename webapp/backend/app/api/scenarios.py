@@ -4,17 +4,60 @@ Scenarios API Router
 Endpoints for retrieving and navigating scenario content.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from app.models import Category, Scenario, ScenarioSummary
-from fastapi import APIRouter, HTTPException, Request
+from app.models import (
+    SCENARIO_LIST_ADAPTER,
+    Category,
+    Scenario,
+    ScenarioSummary,
+    Step,
+)
+from fastapi import APIRouter, HTTPException, Request, Response
 
 router = APIRouter()
 
+# Content only changes on restart; clients revalidate with If-None-Match
+CACHE_CONTROL = "public, max-age=300"
+
+
+def _cache_headers(request: Request) -> Dict[str, str]:
+    """Validator and freshness headers for the loaded content."""
+    return {"ETag": request.app.state.content_etag, "Cache-Control": CACHE_CONTROL}
+
+
+def _json_payload(request: Request, payload: bytes) -> Response:
+    """Send serialized JSON directly, skipping response model validation."""
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers=_cache_headers(request),
+    )
+
+
+def _not_modified(request: Request, response: Response) -> Optional[Response]:
+    """
+    Tag the response with the content ETag.
+
+    Returns a 304 response when the client's If-None-Match already holds
+    the current ETag, so the endpoint can skip building the body.
+    """
+    etag = request.app.state.content_etag
+    headers = _cache_headers(request)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return None
+
 
 @router.get("", response_model=List[ScenarioSummary])
 async def list_scenarios(
     request: Request,
+    response: Response,
     category: Optional[str] = None,
     difficulty: Optional[str] = None,
     tag: Optional[str] = None,
@@ -26,132 +69,40 @@ async def list_scenarios(
     - **difficulty**: Filter by difficulty level
     - **tag**: Filter by tag
     """
-    scenarios = request.app.state.scenarios
+    not_modified = _not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
 
-    summaries = []
-    for scenario in scenarios.values():
-        # Apply filters
-        if category and scenario.category != category:
-            continue
-        if difficulty and scenario.difficulty.value != difficulty:
-            continue
-        if tag and tag not in scenario.tags:
-            continue
-
-        summaries.append(
-            ScenarioSummary(
-                id=scenario.id,
-                title=scenario.title,
-                description=scenario.description,
-                difficulty=scenario.difficulty,
-                estimated_duration_minutes=scenario.estimated_duration_minutes,
-                tags=scenario.tags,
-                category=scenario.category,
-                order=scenario.order,
-                step_count=len(scenario.steps),
-            )
-        )
+    if not (category or difficulty or tag):
+        return _json_payload(request, request.app.state.summaries_json)
 
-    # Sort by order, then by title
-    summaries.sort(key=lambda x: (x.order, x.title))
-    return summaries
+    summaries = request.app.state.summaries
+
+    # Summaries are pre-sorted by order, then by title
+    filtered = [
+        summary
+        for summary in summaries
+        if (not category or summary.category == category)
+        and (not difficulty or summary.difficulty.value == difficulty)
+        and (not tag or tag in summary.tags)
+    ]
+    return _json_payload(request, SCENARIO_LIST_ADAPTER.dump_json(filtered))
 
 
 @router.get("/categories", response_model=List[Category])
-async def list_categories(request: Request):
+async def list_categories(request: Request, response: Response):
     """
     List all scenario categories with their scenarios.
     """
-    scenarios = request.app.state.scenarios
-
-    # Define category metadata
-    category_meta = {
-        "getting-started": {
-            "title": "Getting Started",
-            "description": "Prerequisites, installation, and initial setup",
-            "icon": "rocket",
-            "order": 1,
-        },
-        "configuration": {
-            "title": "Configuration",
-            "description": "Blueprint templates and YAML configuration patterns",
-            "icon": "settings",
-            "order": 2,
-        },
-        "deployment": {
-            "title": "Deployment",
-            "description": "Local and Docker deployment workflows",
-            "icon": "cloud-arrow-up",
-            "order": 3,
-        },
-        "workflows": {
-            "title": "Workflows",
-            "description": "Feature branches and development patterns",
-            "icon": "git-branch",
-            "order": 4,
-        },
-        "integration": {
-            "title": "Integration",
-            "description": "Git integration and CI/CD pipelines",
-            "icon": "plug",
-            "order": 5,
-        },
-        "troubleshooting": {
-            "title": "Troubleshooting",
-            "description": "Common issues and solutions",
-            "icon": "wrench",
-            "order": 6,
-        },
-    }
-
-    # Group scenarios by category
-    categories_dict = {}
-    for scenario in scenarios.values():
-        cat_id = scenario.category
-        if cat_id not in categories_dict:
-            meta = category_meta.get(
-                cat_id,
-                {
-                    "title": cat_id.replace("-", " ").title(),
-                    "description": f"Scenarios for {cat_id}",
-                    "icon": "folder",
-                    "order": 99,
-                },
-            )
-            categories_dict[cat_id] = Category(
-                id=cat_id,
-                title=meta["title"],
-                description=meta["description"],
-                icon=meta["icon"],
-                order=meta["order"],
-                scenarios=[],
-            )
-
-        categories_dict[cat_id].scenarios.append(
-            ScenarioSummary(
-                id=scenario.id,
-                title=scenario.title,
-                description=scenario.description,
-                difficulty=scenario.difficulty,
-                estimated_duration_minutes=scenario.estimated_duration_minutes,
-                tags=scenario.tags,
-                category=scenario.category,
-                order=scenario.order,
-                step_count=len(scenario.steps),
-            )
-        )
+    not_modified = _not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
 
-    # Sort scenarios within each category
-    for category in categories_dict.values():
-        category.scenarios.sort(key=lambda x: (x.order, x.title))
-
-    # Sort categories by order
-    result = sorted(categories_dict.values(), key=lambda x: x.order)
-    return result
+    return _json_payload(request, request.app.state.categories_json)
 
 
 @router.get("/{scenario_id}", response_model=Scenario)
-async def get_scenario(request: Request, scenario_id: str):
+async def get_scenario(request: Request, response: Response, scenario_id: str):
     """
     Get detailed information about a specific scenario.
     """
@@ -162,27 +113,34 @@ async def get_scenario(request: Request, scenario_id: str):
             status_code=404, detail=f"Scenario '{scenario_id}' not found"
         )
 
-    return scenarios[scenario_id]
+    not_modified = _not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
+    return _json_payload(request, request.app.state.scenario_json[scenario_id])
 
 
-@router.get("/{scenario_id}/steps/{step_id}")
-async def get_step(request: Request, scenario_id: str, step_id: str):
+@router.get("/{scenario_id}/steps/{step_id}", response_model=Step)
+async def get_step(
+    request: Request, response: Response, scenario_id: str, step_id: str
+):
     """
     Get a specific step from a scenario.
     """
-    scenarios = request.app.state.scenarios
-
-    if scenario_id not in scenarios:
+    if scenario_id not in request.app.state.scenarios:
         raise HTTPException(
             status_code=404, detail=f"Scenario '{scenario_id}' not found"
         )
 
-    scenario = scenarios[scenario_id]
-    for step in scenario.steps:
-        if step.id == step_id:
-            return step
+    step = request.app.state.step_index.get((scenario_id, step_id))
+    if step is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Step '{step_id}' not found in scenario '{scenario_id}'",
+        )
 
-    raise HTTPException(
-        status_code=404,
-        detail=f"Step '{step_id}' not found in scenario '{scenario_id}'",
-    )
+    not_modified = _not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
+    return step
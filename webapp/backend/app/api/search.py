@@ -4,8 +4,10 @@ Search API Router
 Endpoints for searching scenario content.
 """
 
-from typing import List
+from operator import attrgetter
+from typing import AbstractSet, FrozenSet, List, Optional, Tuple
 
+from app.content.search_index import char_mask
 from app.models import SearchResult
 from fastapi import APIRouter, Query, Request
 
@@ -16,39 +18,66 @@ def calculate_relevance(query: str, text: str) -> float:
     """Calculate simple relevance score based on query matches."""
     query_lower = query.lower()
     text_lower = text.lower()
+    score, _ = score_relevance(
+        query_lower, frozenset(query_lower.split()), text_lower, set(text_lower.split())
+    )
+    return score
+
+
+def score_relevance(
+    query_lower: str,
+    query_words: FrozenSet[str],
+    text_lower: str,
+    text_words: AbstractSet[str],
+    may_contain: bool = True,
+) -> Tuple[float, int]:
+    """
+    Relevance of already-lowercased text to a lowercased query.
 
-    # Exact match gets highest score
-    if query_lower == text_lower:
-        return 1.0
+    Same scoring as ``calculate_relevance``, for callers that keep the
+    lowercased text and its words around instead of recomputing them.
+    Pass ``may_contain=False`` when the text is known not to contain the
+    query (e.g. from a character bloom) to skip the substring scan.
 
-    # Title/word match
-    if query_lower in text_lower:
-        # Earlier position = higher relevance
-        position = text_lower.index(query_lower)
-        position_score = max(0, 1 - (position / len(text_lower)))
-        return 0.7 + (0.3 * position_score)
+    Returns the score and the query's position in the text, or -1 when it
+    is not a substring, so snippets can reuse the match.
+    """
+    if may_contain:
+        # Exact match gets highest score
+        if query_lower == text_lower:
+            return 1.0, 0
+
+        # Title/word match; find() scans once where `in` plus index() did twice
+        position = text_lower.find(query_lower)
+        if position != -1:
+            # Earlier position = higher relevance
+            position_score = max(0, 1 - (position / len(text_lower)))
+            return 0.7 + (0.3 * position_score), position
 
     # Word-level matching
-    query_words = set(query_lower.split())
-    text_words = set(text_lower.split())
-    matching_words = query_words.intersection(text_words)
+    if query_words.isdisjoint(text_words):
+        return 0.0, -1
 
-    if matching_words:
-        return 0.3 * (len(matching_words) / len(query_words))
+    matching_words = query_words.intersection(text_words)
+    return 0.3 * (len(matching_words) / len(query_words)), -1
 
-    return 0.0
 
+def get_snippet(
+    text: str, query: str, max_length: int = 150, position: Optional[int] = None
+) -> str:
+    """
+    Extract a relevant snippet containing the query.
 
-def get_snippet(text: str, query: str, max_length: int = 150) -> str:
-    """Extract a relevant snippet containing the query."""
-    query_lower = query.lower()
-    text_lower = text.lower()
+    ``position`` is the query's offset in the text when the caller already
+    knows it (-1 for no match), which skips searching the text again.
+    """
+    if position is None:
+        position = text.lower().find(query.lower())
 
-    if query_lower in text_lower:
-        start = text_lower.index(query_lower)
+    if position != -1:
         # Expand to include surrounding context
-        snippet_start = max(0, start - 50)
-        snippet_end = min(len(text), start + len(query) + 100)
+        snippet_start = max(0, position - 50)
+        snippet_end = min(len(text), position + len(query) + 100)
 
         snippet = text[snippet_start:snippet_end]
         if snippet_start > 0:
@@ -75,13 +104,38 @@ async def search(
     - Scenario titles and descriptions
     - Step titles and content
     - Tags
+
+    Candidate fields come from the inverted index built at startup; only
+    those are scored.
     """
-    scenarios = request.app.state.scenarios
+    index = request.app.state.search_index
+    candidates = index.candidates(q)
+    q_lower = q.lower()
+    q_words = frozenset(q_lower.split())
+    q_mask = char_mask(q_lower)
+
+    def relevance(ordinal: int) -> Tuple[float, int]:
+        # Fields the index ruled out cannot match, so skip scoring them
+        if candidates is not None and ordinal not in candidates:
+            return 0.0, -1
+        # Lowercased text and its words were computed once at startup; a
+        # query character missing from the text rules out a substring match,
+        # though shared words can still score
+        return score_relevance(
+            q_lower,
+            q_words,
+            index.lowered[ordinal],
+            index.words[ordinal],
+            may_contain=q_mask & index.char_masks[ordinal] == q_mask,
+        )
+
     results = []
 
-    for scenario in scenarios.values():
+    for entry in index.matching_entries(candidates):
+        scenario = entry.scenario
+
         # Search in scenario title
-        title_relevance = calculate_relevance(q, scenario.title)
+        title_relevance, _ = relevance(entry.title)
         if title_relevance > 0:
             results.append(
                 SearchResult(
@@ -94,21 +148,23 @@ async def search(
             )
 
         # Search in scenario description
-        desc_relevance = calculate_relevance(q, scenario.description)
+        desc_relevance, desc_position = relevance(entry.description)
         if desc_relevance > 0 and title_relevance == 0:
             results.append(
                 SearchResult(
                     scenario_id=scenario.id,
                     scenario_title=scenario.title,
                     match_type="content",
-                    snippet=get_snippet(scenario.description, q),
+                    snippet=get_snippet(
+                        scenario.description, q, position=desc_position
+                    ),
                     relevance_score=desc_relevance * 0.9,
                 )
             )
 
         # Search in tags
-        for tag in scenario.tags:
-            tag_relevance = calculate_relevance(q, tag)
+        for tag, tag_ordinal in zip(scenario.tags, entry.tags):
+            tag_relevance, _ = relevance(tag_ordinal)
             if tag_relevance > 0.5:
                 results.append(
                     SearchResult(
@@ -122,8 +178,9 @@ async def search(
                 break  # Only one tag match per scenario
 
         # Search in steps
-        for step in scenario.steps:
-            step_title_relevance = calculate_relevance(q, step.title)
+        for indexed_step in entry.steps:
+            step = indexed_step.step
+            step_title_relevance, _ = relevance(indexed_step.title)
             if step_title_relevance > 0:
                 results.append(
                     SearchResult(
@@ -137,7 +194,7 @@ async def search(
                     )
                 )
 
-            step_content_relevance = calculate_relevance(q, step.content)
+            step_content_relevance, content_position = relevance(indexed_step.content)
             if step_content_relevance > 0 and step_title_relevance == 0:
                 results.append(
                     SearchResult(
@@ -146,11 +203,11 @@ async def search(
                         step_id=step.id,
                         step_title=step.title,
                         match_type="content",
-                        snippet=get_snippet(step.content, q),
+                        snippet=get_snippet(step.content, q, position=content_position),
                         relevance_score=step_content_relevance * 0.7,
                     )
                 )
 
     # Sort by relevance and limit
-    results.sort(key=lambda x: x.relevance_score, reverse=True)
+    results.sort(key=attrgetter("relevance_score"), reverse=True)
     return results[:limit]
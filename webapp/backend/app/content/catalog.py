@@ -0,0 +1,119 @@
+"""
+Scenario Catalog
+
+Listing views derived from the loaded scenarios. They only depend on the
+scenario content, so they are built once at startup and shared by requests.
+"""
+
+import hashlib
+from operator import attrgetter
+from typing import Dict, List, Tuple
+
+from app.models import Category, Scenario, ScenarioSummary, Step
+
+# Category metadata
+CATEGORY_META = {
+    "getting-started": {
+        "title": "Getting Started",
+        "description": "Prerequisites, installation, and initial setup",
+        "icon": "rocket",
+        "order": 1,
+    },
+    "configuration": {
+        "title": "Configuration",
+        "description": "Blueprint templates and YAML configuration patterns",
+        "icon": "settings",
+        "order": 2,
+    },
+    "deployment": {
+        "title": "Deployment",
+        "description": "Local and Docker deployment workflows",
+        "icon": "cloud-arrow-up",
+        "order": 3,
+    },
+    "workflows": {
+        "title": "Workflows",
+        "description": "Feature branches and development patterns",
+        "icon": "git-branch",
+        "order": 4,
+    },
+    "integration": {
+        "title": "Integration",
+        "description": "Git integration and CI/CD pipelines",
+        "icon": "plug",
+        "order": 5,
+    },
+    "troubleshooting": {
+        "title": "Troubleshooting",
+        "description": "Common issues and solutions",
+        "icon": "wrench",
+        "order": 6,
+    },
+}
+
+
+def build_summaries(scenarios: Dict[str, Scenario]) -> List[ScenarioSummary]:
+    """Summaries of all scenarios, sorted by order, then by title."""
+    summaries = [
+        ScenarioSummary(
+            id=scenario.id,
+            title=scenario.title,
+            description=scenario.description,
+            difficulty=scenario.difficulty,
+            estimated_duration_minutes=scenario.estimated_duration_minutes,
+            tags=scenario.tags,
+            category=scenario.category,
+            order=scenario.order,
+            step_count=len(scenario.steps),
+        )
+        for scenario in scenarios.values()
+    ]
+    summaries.sort(key=attrgetter("order", "title"))
+    return summaries
+
+
+def build_categories(summaries: List[ScenarioSummary]) -> List[Category]:
+    """Group sorted summaries by category, ordered by category order."""
+    categories_dict: Dict[str, Category] = {}
+    for summary in summaries:
+        cat_id = summary.category
+        if cat_id not in categories_dict:
+            meta = CATEGORY_META.get(
+                cat_id,
+                {
+                    "title": cat_id.replace("-", " ").title(),
+                    "description": f"Scenarios for {cat_id}",
+                    "icon": "folder",
+                    "order": 99,
+                },
+            )
+            categories_dict[cat_id] = Category(
+                id=cat_id,
+                title=meta["title"],
+                description=meta["description"],
+                icon=meta["icon"],
+                order=meta["order"],
+                scenarios=[],
+            )
+
+        # Summaries arrive sorted, so each category stays sorted too
+        categories_dict[cat_id].scenarios.append(summary)
+
+    return sorted(categories_dict.values(), key=attrgetter("order"))
+
+
+def build_step_index(scenarios: Dict[str, Scenario]) -> Dict[Tuple[str, str], Step]:
+    """All steps keyed by ``(scenario_id, step_id)``."""
+    return {
+        (scenario_id, step.id): step
+        for scenario_id, scenario in scenarios.items()
+        for step in scenario.steps
+    }
+
+
+def content_etag(scenarios: Dict[str, Scenario]) -> str:
+    """Strong ETag identifying the loaded scenario content."""
+    digest = hashlib.sha256()
+    for scenario_id in sorted(scenarios):
+        digest.update(scenarios[scenario_id].model_dump_json().encode("utf-8"))
+    return f'"{digest.hexdigest()[:16]}"'
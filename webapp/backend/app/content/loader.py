@@ -4,17 +4,25 @@ Content Loader
 Loads scenario definitions from YAML files.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple, Union
 
 import yaml
 from app.models import CodeBlock, DifficultyLevel, Scenario, Step, StepType
 
+# LibYAML-backed loader when PyYAML was built with it; same results as safe_load
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Upper bound on threads used to read scenario files at startup
+_MAX_LOAD_WORKERS = 16
+
 
 def load_scenario_from_yaml(file_path: Path) -> Scenario:
     """Load a single scenario from a YAML file."""
     with open(file_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     # Parse steps
     steps = []
@@ -26,7 +34,7 @@ def load_scenario_from_yaml(file_path: Path) -> Scenario:
                 language=code_data.get("language", "bash"),
                 content=code_data.get("content", ""),
                 filename=code_data.get("filename"),
-                highlight_lines=code_data.get("highlight_lines"),
+                highlight_lines=code_data.get("highlight_lines") or (),
             )
 
         step = Step(
@@ -36,8 +44,8 @@ def load_scenario_from_yaml(file_path: Path) -> Scenario:
             content=step_data.get("content", ""),
             code=code,
             expected_output=step_data.get("expected_output"),
-            tips=step_data.get("tips"),
-            warnings=step_data.get("warnings"),
+            tips=step_data.get("tips") or (),
+            warnings=step_data.get("warnings") or (),
             duration_minutes=step_data.get("duration_minutes"),
             checkpoint_question=step_data.get("checkpoint_question"),
         )
@@ -49,16 +57,24 @@ def load_scenario_from_yaml(file_path: Path) -> Scenario:
         description=data["description"],
         difficulty=DifficultyLevel(data.get("difficulty", "beginner")),
         estimated_duration_minutes=data.get("estimated_duration_minutes", 15),
-        prerequisites=data.get("prerequisites", []),
-        learning_outcomes=data.get("learning_outcomes", []),
-        tags=data.get("tags", []),
+        prerequisites=data.get("prerequisites") or (),
+        learning_outcomes=data.get("learning_outcomes") or (),
+        tags=data.get("tags") or (),
         steps=steps,
-        related_scenarios=data.get("related_scenarios", []),
+        related_scenarios=data.get("related_scenarios") or (),
         category=data.get("category", "general"),
         order=data.get("order", 0),
     )
 
 
+def _try_load_scenario(file_path: Path) -> Tuple[Path, Union[Scenario, Exception]]:
+    """Load a scenario, returning the error instead of raising it."""
+    try:
+        return file_path, load_scenario_from_yaml(file_path)
+    except Exception as e:
+        return file_path, e
+
+
 def load_all_scenarios() -> Dict[str, Scenario]:
     """Load all scenarios from the content/scenarios directory."""
     scenarios = {}
@@ -68,13 +84,19 @@ def load_all_scenarios() -> Dict[str, Scenario]:
         print(f"Warning: Scenarios directory not found at {content_dir}")
         return scenarios
 
-    for yaml_file in sorted(content_dir.glob("*.yaml")):
-        try:
-            scenario = load_scenario_from_yaml(yaml_file)
-            scenarios[scenario.id] = scenario
-            print(f"Loaded scenario: {scenario.id} ({len(scenario.steps)} steps)")
-        except Exception as e:
-            print(f"Error loading {yaml_file}: {e}")
+    yaml_files = sorted(content_dir.glob("*.yaml"))
+
+    # Files are independent, so read them in parallel; map() keeps file order
+    workers = max(1, min(_MAX_LOAD_WORKERS, os.cpu_count() or 4, len(yaml_files)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_try_load_scenario, yaml_files))
+
+    for yaml_file, result in results:
+        if isinstance(result, Exception):
+            print(f"Error loading {yaml_file}: {result}")
+            continue
+        scenarios[result.id] = result
+        print(f"Loaded scenario: {result.id} ({len(result.steps)} steps)")
 
     print(f"Loaded {len(scenarios)} scenarios total")
     return scenarios
@@ -0,0 +1,155 @@
+"""
+Search Index
+
+Token-level inverted index over scenario text, built once at startup so a
+search only scores the fields that can possibly match the query.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set
+
+from app.models import Scenario, Step
+
+# Word tokens as seen by the index; matches are always made on lowercased text
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def char_mask(text: str) -> int:
+    """
+    64-bit bloom of the characters in ``text``.
+
+    If ``char_mask(a) & ~char_mask(b)`` is non-zero, ``a`` has a character
+    missing from ``b`` and so cannot be a substring of it.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+@dataclass(slots=True)
+class IndexedStep:
+    """A step and the index ordinals of its title and content."""
+
+    step: Step
+    title: int
+    content: int
+
+
+@dataclass(slots=True)
+class IndexedScenario:
+    """A scenario and the index ordinals of its searchable fields."""
+
+    scenario: Scenario
+    title: int
+    description: int
+    tags: List[int] = field(default_factory=list)
+    steps: List[IndexedStep] = field(default_factory=list)
+
+
+class SearchIndex:
+    """
+    Inverted index mapping lowercased word tokens to the fields containing them.
+
+    Every searchable text (scenario title, description, tags, step titles and
+    content) gets an ordinal. ``candidates`` narrows a query down to the
+    ordinals that could score above zero under the search relevance rules, so
+    the endpoint skips the rest of the corpus without changing its results.
+    """
+
+    def __init__(self, scenarios: Dict[str, Scenario]):
+        self.entries: List[IndexedScenario] = []
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._owner: List[int] = []  # field ordinal -> position in entries
+        # Per-field lowercased text, whitespace-split words and character
+        # bloom, by ordinal
+        self.lowered: List[str] = []
+        self.words: List[FrozenSet[str]] = []
+        self.char_masks: List[int] = []
+
+        for scenario in scenarios.values():
+            entry = IndexedScenario(
+                scenario=scenario,
+                title=self._add(scenario.title),
+                description=self._add(scenario.description),
+                tags=[self._add(tag) for tag in scenario.tags],
+                steps=[
+                    IndexedStep(
+                        step=step,
+                        title=self._add(step.title),
+                        content=self._add(step.content),
+                    )
+                    for step in scenario.steps
+                ],
+            )
+            self.entries.append(entry)
+
+        self._postings = dict(self._postings)
+        self._vocabulary = tuple(self._postings)
+
+    def _add(self, text: str) -> int:
+        """Register ``text`` as a field of the scenario being indexed."""
+        ordinal = len(self._owner)
+        # Fields are added before their scenario is appended to entries
+        self._owner.append(len(self.entries))
+        text_lower = text.lower()
+        self.lowered.append(text_lower)
+        self.words.append(frozenset(text_lower.split()))
+        self.char_masks.append(char_mask(text_lower))
+        for token in _TOKEN_RE.findall(text_lower):
+            self._postings[token].add(ordinal)
+        return ordinal
+
+    def candidates(self, query: str) -> Optional[FrozenSet[int]]:
+        """
+        Return the ordinals of fields that may match ``query``.
+
+        A field can only score if the query is a substring of it, or if one
+        of the query's whitespace-separated words is also a word of the field.
+        Both imply conditions on word tokens:
+
+        - substring: every query token occurs inside some token of the field
+        - shared word: every token of that query word is a token of the field
+
+        Returns None when the query has a word without any word characters
+        (e.g. ``&&``); the index cannot rule anything out and callers must
+        consider every field.
+        """
+        query_lower = query.lower()
+        word_tokens = [_TOKEN_RE.findall(word) for word in query_lower.split()]
+        if not word_tokens or not all(word_tokens):
+            return None
+
+        # Substring branch: tokens may be partial at the query's edges, so
+        # match them against the vocabulary rather than exactly
+        substring_hits: Optional[Set[int]] = None
+        for token in {t for tokens in word_tokens for t in tokens}:
+            hits: Set[int] = set()
+            for word in self._vocabulary:
+                if token in word:
+                    hits |= self._postings[word]
+            substring_hits = hits if substring_hits is None else substring_hits & hits
+            if not substring_hits:
+                break
+
+        result: Set[int] = set(substring_hits or ())
+
+        # Shared-word branch: exact token lookups
+        for tokens in word_tokens:
+            shared = set(self._postings.get(tokens[0], ()))
+            for token in tokens[1:]:
+                shared &= self._postings.get(token, set())
+            result |= shared
+
+        return frozenset(result)
+
+    def matching_entries(
+        self, candidates: Optional[FrozenSet[int]]
+    ) -> List[IndexedScenario]:
+        """Scenarios owning at least one candidate field, in load order."""
+        if candidates is None:
+            return self.entries
+        positions = sorted({self._owner[ordinal] for ordinal in candidates})
+        return [self.entries[position] for position in positions]
@@ -8,15 +8,35 @@ import os
 from contextlib import asynccontextmanager
 
 from app.api import progress, scenarios, search
+from app.content.catalog import (
+    build_categories,
+    build_step_index,
+    build_summaries,
+    content_etag,
+)
 from app.content.loader import load_all_scenarios
+from app.content.search_index import SearchIndex
+from app.models import CATEGORY_LIST_ADAPTER, SCENARIO_LIST_ADAPTER
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Load scenarios on startup."""
+    """Load scenarios and build the listings and search index on startup."""
     app.state.scenarios = load_all_scenarios()
+    app.state.summaries = build_summaries(app.state.scenarios)
+    app.state.categories = build_categories(app.state.summaries)
+    app.state.step_index = build_step_index(app.state.scenarios)
+    app.state.content_etag = content_etag(app.state.scenarios)
+    # Serialized bodies for the unfiltered read-only endpoints
+    app.state.summaries_json = SCENARIO_LIST_ADAPTER.dump_json(app.state.summaries)
+    app.state.categories_json = CATEGORY_LIST_ADAPTER.dump_json(app.state.categories)
+    app.state.scenario_json = {
+        scenario_id: scenario.model_dump_json().encode("utf-8")
+        for scenario_id, scenario in app.state.scenarios.items()
+    }
+    app.state.search_index = SearchIndex(app.state.scenarios)
     yield
 
 
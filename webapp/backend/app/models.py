@@ -3,9 +3,14 @@ Pydantic models for the Guide API.
 """
 
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Scenario content is loaded once and shared by every request (including the
+# cached JSON payloads and ETag), so its models reject attribute assignment;
+# list-like fields are tuples, whose empty default is a shared singleton
+_CONTENT_CONFIG = ConfigDict(frozen=True)
 
 
 class DifficultyLevel(str, Enum):
@@ -31,23 +36,27 @@ class StepType(str, Enum):
 class CodeBlock(BaseModel):
     """A code block with language and content."""
 
+    model_config = _CONTENT_CONFIG
+
     language: str = "bash"
     content: str
     filename: Optional[str] = None
-    highlight_lines: Optional[List[int]] = None
+    highlight_lines: Tuple[int, ...] = ()
 
 
 class Step(BaseModel):
     """A single step in a scenario."""
 
+    model_config = _CONTENT_CONFIG
+
     id: str
     title: str
     type: StepType = StepType.INFO
     content: str
     code: Optional[CodeBlock] = None
     expected_output: Optional[str] = None
-    tips: Optional[List[str]] = None
-    warnings: Optional[List[str]] = None
+    tips: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
     duration_minutes: Optional[int] = None
     checkpoint_question: Optional[str] = None
 
@@ -55,16 +64,18 @@ class Step(BaseModel):
 class Scenario(BaseModel):
     """A complete scenario with metadata and steps."""
 
+    model_config = _CONTENT_CONFIG
+
     id: str
     title: str
     description: str
     difficulty: DifficultyLevel = DifficultyLevel.BEGINNER
     estimated_duration_minutes: int
-    prerequisites: List[str] = Field(default_factory=list)
-    learning_outcomes: List[str] = Field(default_factory=list)
-    tags: List[str] = Field(default_factory=list)
+    prerequisites: Tuple[str, ...] = ()
+    learning_outcomes: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
     steps: List[Step]
-    related_scenarios: List[str] = Field(default_factory=list)
+    related_scenarios: Tuple[str, ...] = ()
     category: str = "general"
     order: int = 0
 
@@ -72,12 +83,14 @@ class Scenario(BaseModel):
 class ScenarioSummary(BaseModel):
     """Summary of a scenario for listing."""
 
+    model_config = _CONTENT_CONFIG
+
     id: str
     title: str
     description: str
     difficulty: DifficultyLevel
     estimated_duration_minutes: int
-    tags: List[str]
+    tags: Tuple[str, ...]
     category: str
     order: int
     step_count: int
@@ -86,6 +99,8 @@ class ScenarioSummary(BaseModel):
 class Category(BaseModel):
     """A category grouping scenarios."""
 
+    model_config = _CONTENT_CONFIG
+
     id: str
     title: str
     description: str
@@ -97,6 +112,8 @@ class Category(BaseModel):
 class SearchResult(BaseModel):
     """A search result item."""
 
+    model_config = _CONTENT_CONFIG
+
     scenario_id: str
     scenario_title: str
     step_id: Optional[str] = None
@@ -120,3 +137,8 @@ class ProgressUpdate(BaseModel):
 
     step_id: str
     completed: bool = True
+
+
+# Prebuilt adapters for serializing whole lists in one pass
+SCENARIO_LIST_ADAPTER = TypeAdapter(List[ScenarioSummary])
+CATEGORY_LIST_ADAPTER = TypeAdapter(List[Category])
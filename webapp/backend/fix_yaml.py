@@ -10,77 +10,143 @@ Solution: Quote these strings with double quotes.
 
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 scenarios_dir = "app/content/scenarios"
 
+# "      - something": list item indent and value
+_LINE_RE = re.compile(r"^(\s*- )(.+)$")
+# The same match over a whole file; [^\S\n] keeps \s from crossing lines
+_LIST_ITEM_RE = re.compile(r"^([^\S\n]*- )(.+)$", re.MULTILINE)
+# Values that cannot start a plain YAML scalar and must be quoted
+_NEEDS_QUOTE_STARTS = ("`", "*")
+
+
+def _quote_value(indent, value):
+    """Return the quoted line for a list item value, or None if it is fine."""
+    value = value.rstrip()
+
+    # Already quoted? Skip
+    if value.startswith('"') and value.endswith('"'):
+        return None
+    if value.startswith("'") and value.endswith("'"):
+        return None
+
+    # Needs quoting if:
+    # 1. Starts with ` or *
+    # 2. Contains unquoted backticks
+    if value.startswith(_NEEDS_QUOTE_STARTS) or "`" in value:
+        # Wrap in double quotes, escaping any existing double quotes
+        escaped_value = value.replace('"', '\\"')
+        return f'{indent}"{escaped_value}"\n'
+
+    return None
+
 
 def fix_yaml_line(line):
     """Fix a single line if it has problematic patterns."""
     # Pattern: starts with spaces, dash, space, then content
     # If the content contains backticks or starts with **, we need to quote it
 
+    # Most lines are not list items, or are items that need no quoting;
+    # reject them with string checks before running the regex
+    stripped = line.lstrip()
+    if not stripped.startswith("- "):
+        return line
+    if "`" not in stripped and not stripped.startswith("- *"):
+        return line
+
     # Match: "      - something" where something needs quoting
-    match = re.match(r"^(\s*- )(.+)$", line)
+    match = _LINE_RE.match(line)
     if match:
-        indent = match.group(1)
-        value = match.group(2).rstrip()
-
-        # Already quoted? Skip
-        if value.startswith('"') and value.endswith('"'):
-            return line
-        if value.startswith("'") and value.endswith("'"):
-            return line
-
-        # Needs quoting if:
-        # 1. Starts with ` or *
-        # 2. Contains unquoted backticks
-        needs_quote = False
-        if value.startswith("`") or value.startswith("*"):
-            needs_quote = True
-        elif "`" in value:
-            needs_quote = True
-
-        if needs_quote:
-            # Wrap in double quotes, escaping any existing double quotes
-            escaped_value = value.replace('"', '\\"')
-            return f'{indent}"{escaped_value}"\n'
+        fixed = _quote_value(match.group(1), match.group(2))
+        if fixed is not None:
+            return fixed
 
     return line
 
 
-def process_file(filepath):
-    """Process a single YAML file."""
+def fix_yaml_text(text):
+    """
+    Apply fix_yaml_line to every line of ``text`` in one regex pass.
+
+    Returns the fixed text and a list of ``(line_number, old, new)`` changes.
+    Only list item lines are visited; everything else is copied as-is.
+    """
+    pieces = []
+    changes = []
+    pos = 0
+    line_number = 1
+    for match in _LIST_ITEM_RE.finditer(text):
+        fixed = _quote_value(match.group(1), match.group(2))
+        if fixed is None:
+            continue
+
+        start = match.start()
+        # Replace the whole line, including its newline if it has one
+        has_newline = text.startswith("\n", match.end())
+        end = match.end() + has_newline
+        line_number += text.count("\n", pos, start)
+        pieces.append(text[pos:start])
+        pieces.append(fixed)
+        changes.append((line_number, text[start:end], fixed))
+        pos = end
+        line_number += has_newline
+
+    pieces.append(text[pos:])
+    return "".join(pieces), changes
+
+
+def _fix_file(filepath):
+    """Fix a file in place; return the change count and report lines.
+
+    Report lines end in a newline so a file's report is written in one call.
+    """
     with open(filepath, "r") as f:
-        lines = f.readlines()
-
-    changes = 0
-    new_lines = []
-    for i, line in enumerate(lines):
-        new_line = fix_yaml_line(line)
-        if new_line != line:
-            print(f"  Line {i+1}: {line.rstrip()[:60]}")
-            print(f"       ->: {new_line.rstrip()[:60]}")
-            changes += 1
-        new_lines.append(new_line)
-
-    if changes > 0:
+        text = f.read()
+
+    new_text, changes = fix_yaml_text(text)
+    report = []
+    for line_number, line, new_line in changes:
+        report.append(f"  Line {line_number}: {line.rstrip()[:60]}\n")
+        report.append(f"       ->: {new_line.rstrip()[:60]}\n")
+
+    if changes:
         with open(filepath, "w") as f:
-            f.writelines(new_lines)
-        print(f"  Fixed {changes} lines")
+            f.write(new_text)
+        report.append(f"  Fixed {len(changes)} lines\n")
+
+    return len(changes), report
 
+
+def process_file(filepath):
+    """Process a single YAML file."""
+    changes, report = _fix_file(filepath)
+    sys.stdout.write("".join(report))
     return changes
 
 
 def main():
-    total_changes = 0
-    for filename in sorted(os.listdir(scenarios_dir)):
-        if filename.endswith(".yaml"):
-            filepath = os.path.join(scenarios_dir, filename)
-            print(f"\nProcessing {filename}:")
-            changes = process_file(filepath)
+    with os.scandir(scenarios_dir) as it:
+        entries = sorted(
+            (entry for entry in it if entry.name.endswith(".yaml")),
+            key=lambda entry: entry.name,
+        )
+    filenames = [entry.name for entry in entries]
+    filepaths = [entry.path for entry in entries]
+
+    # Files are independent; workers buffer their reports so output is
+    # printed in file order once map() yields each result
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_fix_file, filepaths)
+
+        total_changes = 0
+        for filename, (changes, report) in zip(filenames, results):
             total_changes += changes
             if changes == 0:
-                print("  No changes needed")
+                report.append("  No changes needed\n")
+            sys.stdout.write(f"\nProcessing {filename}:\n" + "".join(report))
 
     print(f"\n\nTotal changes: {total_changes}")
 
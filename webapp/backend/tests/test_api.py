@@ -3,17 +3,41 @@ Tests for the API endpoints.
 """
 
 import pytest
+from app.api import progress
+from app.api.search import calculate_relevance, score_relevance
+from app.content.search_index import char_mask
 from app.main import app
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client."""
+    """Create a test client, starting the app once for the whole session."""
     with TestClient(app) as client:
         yield client
 
 
+@pytest.fixture(scope="session")
+def first_scenario_id(client):
+    """ID of the first listed scenario."""
+    return client.get("/api/scenarios/").json()[0]["id"]
+
+
+@pytest.fixture(scope="session")
+def first_step_id(client, first_scenario_id):
+    """ID of the first step of the first listed scenario."""
+    return client.get(f"/api/scenarios/{first_scenario_id}").json()["steps"][0]["id"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_progress():
+    """Clear the in-memory progress store that the shared app keeps."""
+    yield
+    progress._progress_store.clear()
+    progress._completed_steps.clear()
+
+
 class TestHealthEndpoints:
     """Test health check endpoints."""
 
@@ -45,6 +69,37 @@ class TestScenariosAPI:
         # Should have at least one scenario
         assert len(data) > 0
 
+    def test_cached_payloads_match_models(self, client):
+        """Bodies serialized at startup match the response models."""
+        state = client.app.state
+        assert client.get("/api/scenarios").json() == [
+            summary.model_dump(mode="json") for summary in state.summaries
+        ]
+        assert client.get("/api/scenarios/categories").json() == [
+            category.model_dump(mode="json") for category in state.categories
+        ]
+        scenario = next(iter(state.scenarios.values()))
+        response = client.get(f"/api/scenarios/{scenario.id}")
+        assert response.json() == scenario.model_dump(mode="json")
+
+    def test_loaded_content_is_frozen(self, client):
+        """Shared scenario content cannot be modified by a request."""
+        scenario = next(iter(client.app.state.scenarios.values()))
+        with pytest.raises(ValidationError):
+            scenario.title = "changed"
+        with pytest.raises(ValidationError):
+            scenario.steps[0].content = "changed"
+
+    def test_list_scenarios_filtered(self, client, first_scenario_id):
+        """Filtering keeps the precomputed (order, title) ordering."""
+        category = client.app.state.scenarios[first_scenario_id].category
+        response = client.get("/api/scenarios/", params={"category": category})
+        assert response.status_code == 200
+        data = response.json()
+        assert data
+        assert all(item["category"] == category for item in data)
+        assert data == sorted(data, key=lambda x: (x["order"], x["title"]))
+
     def test_list_categories(self, client):
         """Test listing categories."""
         response = client.get("/api/scenarios/categories")
@@ -54,18 +109,43 @@ class TestScenariosAPI:
         # Should have at least one category
         assert len(data) > 0
 
-    def test_get_scenario(self, client):
+    def test_get_scenario(self, client, first_scenario_id):
         """Test getting a specific scenario."""
-        # First get the list to find a valid ID
-        list_response = client.get("/api/scenarios/")
-        scenarios = list_response.json()
-        if scenarios:
-            scenario_id = scenarios[0]["id"]
-            response = client.get(f"/api/scenarios/{scenario_id}")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["id"] == scenario_id
-            assert "steps" in data
+        response = client.get(f"/api/scenarios/{first_scenario_id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == first_scenario_id
+        assert "steps" in data
+
+    def test_get_step(self, client, first_scenario_id, first_step_id):
+        """Steps are looked up by scenario and step ID."""
+        url = f"/api/scenarios/{first_scenario_id}/steps"
+        response = client.get(f"{url}/{first_step_id}")
+        assert response.status_code == 200
+        assert response.json()["id"] == first_step_id
+
+        response = client.get(f"{url}/no-such-step")
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize(
+        "path", ["/api/scenarios", "/api/scenarios/categories", "/api/scenarios/{id}"]
+    )
+    def test_conditional_get(self, client, first_scenario_id, path):
+        """Read-only content endpoints answer a matching If-None-Match with 304."""
+        url = path.format(id=first_scenario_id)
+
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+        response = client.get(url, headers={"If-None-Match": f'"stale", W/{etag}'})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert not response.content
+
+        response = client.get(url, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
 
     def test_get_nonexistent_scenario(self, client):
         """Test getting a scenario that doesn't exist."""
@@ -89,39 +169,85 @@ class TestSearchAPI:
         # Should fail validation (min 2 chars)
         assert response.status_code == 422
 
+    @pytest.mark.parametrize(
+        "query, text",
+        [
+            ("git sync", "Git integration and sync"),
+            ("docker compose", "Run docker builds"),
+            ("fab deploy", "fab deploy --env dev"),
+        ],
+    )
+    def test_char_mask_only_skips_impossible_substrings(self, query, text):
+        """Scoring with the character bloom matches full scoring."""
+        q, t = query.lower(), text.lower()
+        may_contain = char_mask(q) & char_mask(t) == char_mask(q)
+        assert may_contain or q not in t
+        score, position = score_relevance(
+            q, frozenset(q.split()), t, set(t.split()), may_contain=may_contain
+        )
+        assert score == calculate_relevance(query, text)
+        assert position == t.find(q)
+
+    @pytest.mark.parametrize(
+        "query", ["deploy", "Feature Branch", "ci/cd", "fab ", "env:", "&&", "xyzzy"]
+    )
+    def test_search_index_keeps_every_match(self, client, query):
+        """Fields pruned by the search index never match the query."""
+        index = client.app.state.search_index
+        candidates = index.candidates(query)
+        if candidates is None:
+            return
+        for entry in index.entries:
+            scenario = entry.scenario
+            fields = [
+                (entry.title, scenario.title),
+                (entry.description, scenario.description),
+                *zip(entry.tags, scenario.tags),
+            ]
+            for indexed_step in entry.steps:
+                fields.append((indexed_step.title, indexed_step.step.title))
+                fields.append((indexed_step.content, indexed_step.step.content))
+            for ordinal, text in fields:
+                if calculate_relevance(query, text) > 0:
+                    assert ordinal in candidates
+
 
 class TestProgressAPI:
     """Test progress API endpoints."""
 
-    def test_get_progress(self, client):
+    def test_get_progress(self, client, first_scenario_id):
         """Test getting progress for a scenario."""
-        # First get a valid scenario ID
-        list_response = client.get("/api/scenarios/")
-        scenarios = list_response.json()
-        if scenarios:
-            scenario_id = scenarios[0]["id"]
-            response = client.get(f"/api/progress/{scenario_id}")
-            assert response.status_code == 200
-            data = response.json()
-            assert data["scenario_id"] == scenario_id
-
-    def test_update_progress(self, client):
+        response = client.get(f"/api/progress/{first_scenario_id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["scenario_id"] == first_scenario_id
+
+    def test_update_progress(self, client, first_scenario_id, first_step_id):
         """Test updating progress."""
-        # Get a scenario with steps
-        list_response = client.get("/api/scenarios/")
-        scenarios = list_response.json()
-        if scenarios:
-            scenario_id = scenarios[0]["id"]
-            # Get the scenario to find a step ID
-            scenario_response = client.get(f"/api/scenarios/{scenario_id}")
-            scenario = scenario_response.json()
-            if scenario["steps"]:
-                step_id = scenario["steps"][0]["id"]
-                # Update progress
-                response = client.post(
-                    f"/api/progress/{scenario_id}",
-                    json={"step_id": step_id, "completed": True},
-                )
-                assert response.status_code == 200
-                data = response.json()
-                assert step_id in data["completed_steps"]
+        response = client.post(
+            f"/api/progress/{first_scenario_id}",
+            json={"step_id": first_step_id, "completed": True},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert first_step_id in data["completed_steps"]
+
+    def test_progress_keeps_completion_order(
+        self, client, first_scenario_id, first_step_id
+    ):
+        """Completed steps are reported once each, in completion order."""
+        scenario_id = first_scenario_id
+        steps = client.app.state.scenarios[scenario_id].steps
+        first, second = steps[1].id, first_step_id
+
+        for step_id in (first, second, first):
+            client.post(f"/api/progress/{scenario_id}", json={"step_id": step_id})
+        response = client.post(
+            f"/api/progress/{scenario_id}",
+            json={"step_id": first, "completed": False},
+        )
+        assert response.json()["completed_steps"] == [second]
+
+        client.post(f"/api/progress/{scenario_id}", json={"step_id": first})
+        data = client.get(f"/api/progress/{scenario_id}").json()
+        assert data["completed_steps"] == [second, first]
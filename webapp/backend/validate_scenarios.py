@@ -4,10 +4,114 @@ Quick validation script for scenario YAML files.
 Run with: python validate_scenarios.py
 """
 
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    import ryaml
+
+    RYAML_AVAILABLE = True
+except ImportError:
+    RYAML_AVAILABLE = False
+
+# Results of earlier runs, reused for files whose mtime and size are unchanged
+_CACHE_FILE = Path(__file__).parent / ".cache" / "validate_scenarios.json"
+
+# Bump when the checks in _validate_one change, to discard cached results
+_CACHE_VERSION = 1
+
+# LibYAML-backed loader when PyYAML was built with it; same results as safe_load
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parser() -> str:
+    """Name of the YAML parser _load_yaml uses in this run."""
+    if RYAML_AVAILABLE and os.getenv("FAST_YAML") == "1":
+        return "ryaml"
+    return "pyyaml"
+
+
+def _load_yaml(f):
+    """
+    Parse a scenario file opened in binary mode.
+
+    With FAST_YAML=1 and ryaml installed, parsing goes through ryaml; the
+    checks below only read top-level keys and list lengths, which do not
+    depend on PyYAML-specific tag resolution. PyYAML stays the default so
+    results are reproducible.
+    """
+    if _parser() == "ryaml":
+        return ryaml.loads(f.read().decode("utf-8"))
+    return yaml.load(f, Loader=_YamlLoader)
+
+
+def _validate_one(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Validate one scenario file.
+
+    Returns ``(loaded_message, None)`` on success, ``(None, error)`` otherwise.
+    Module-level so it can run in a worker process.
+    """
+    name = Path(path).name
+    try:
+        # Bytes let the parser detect the encoding itself, without a
+        # locale-dependent text decoding layer in front of it
+        with open(path, "rb") as f:
+            data = _load_yaml(f)
+
+        # Check required fields
+        required = ["id", "title", "description", "steps"]
+        missing = [r for r in required if r not in data]
+
+        if missing:
+            return None, f"{name}: Missing fields: {missing}"
+
+        step_count = len(data.get("steps", []))
+        learning_outcomes = len(data.get("learning_outcomes", []))
+        return (
+            f"✓ {name}: {step_count} steps, {learning_outcomes} learning outcomes",
+            None,
+        )
+    except Exception as e:
+        return None, f"{name}: YAML Error: {e}"
+
+
+def _load_cache() -> Dict[str, Any]:
+    """
+    Read cached results; a missing, stale or unreadable cache is empty.
+
+    Results from a different parser (FAST_YAML toggled) count as stale.
+    """
+    try:
+        cache = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    if cache.get("version") != _CACHE_VERSION or cache.get("parser") != _parser():
+        return {}
+    return cache.get("files", {})
+
+
+def _save_cache(files: Dict[str, Any]) -> None:
+    """Atomically replace the cache file; failures only cost the next run."""
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_CACHE_FILE.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": _CACHE_VERSION, "parser": _parser(), "files": files}, f
+            )
+        os.replace(tmp, _CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: could not write validation cache: {e}")
+
 
 def validate_scenarios():
     """Validate all scenario YAML files."""
@@ -20,25 +124,42 @@ def validate_scenarios():
     errors = []
     scenarios_loaded = []
 
-    for yaml_file in sorted(scenarios_dir.glob("*.yaml")):
-        try:
-            with open(yaml_file) as f:
-                data = yaml.safe_load(f)
-
-            # Check required fields
-            required = ["id", "title", "description", "steps"]
-            missing = [r for r in required if r not in data]
-
-            if missing:
-                errors.append(f"{yaml_file.name}: Missing fields: {missing}")
-            else:
-                step_count = len(data.get("steps", []))
-                learning_outcomes = len(data.get("learning_outcomes", []))
-                scenarios_loaded.append(
-                    f"✓ {yaml_file.name}: {step_count} steps, {learning_outcomes} learning outcomes"
-                )
-        except Exception as e:
-            errors.append(f"{yaml_file.name}: YAML Error: {e}")
+    with os.scandir(scenarios_dir) as it:
+        entries = sorted(
+            (entry for entry in it if entry.name.endswith(".yaml")),
+            key=lambda entry: entry.path,
+        )
+    paths = [entry.path for entry in entries]
+
+    # Files unchanged since the last run (same mtime and size) reuse its result
+    cached = _load_cache()
+    keys: Dict[str, List[int]] = {}
+    results: Dict[str, Any] = {}
+    for entry in entries:
+        path = entry.path
+        st = entry.stat()
+        keys[path] = [st.st_mtime_ns, st.st_size]
+        record = cached.get(path)
+        if record and record.get("key") == keys[path]:
+            results[path] = tuple(record["result"])
+
+    # Parsing is CPU-bound and holds the GIL, so files are spread over
+    # processes; map() keeps the sorted file order
+    to_parse = [path for path in paths if path not in results]
+    if to_parse:
+        workers = max(1, min(os.cpu_count() or 1, len(to_parse)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(_validate_one, to_parse, chunksize=4)
+            results.update(zip(to_parse, parsed))
+        _save_cache(
+            {path: {"key": keys[path], "result": results[path]} for path in paths}
+        )
+
+    for loaded, error in (results[path] for path in paths):
+        if error:
+            errors.append(error)
+        else:
+            scenarios_loaded.append(loaded)
 
     print("=== Scenario Validation Results ===")
     print()